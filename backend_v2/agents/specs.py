@@ -4,10 +4,17 @@ AgentSpec and SlotSpec definitions.
 This module defines the declarative specification for each agent type.
 The planner and extractor use these specs to drive conversation flow
 deterministically, without per-agent branching logic.
+
+Spec dataclasses use slots=True (Python 3.10+) - they are read on every
+planner/extractor call, so we skip the per-instance __dict__.
 """
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any, Callable
+from functools import lru_cache
+import string
+import sys
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Callable, Mapping, Tuple
 
 
 class InputType(str, Enum):
@@ -33,14 +40,38 @@ class PhoneSource(str, Enum):
     DIRECT_SLOT = "DIRECT_SLOT"  # From a slot collected during conversation
 
 
-@dataclass
+# A template parsed once into (literal, slot_name) pairs; slot_name is None for trailing text
+TemplatePlan = Tuple[Tuple[str, Optional[str]], ...]
+
+_FORMATTER = string.Formatter()
+
+
+def _compile_template(template: str) -> TemplatePlan:
+    """Parse a {slot_name} template once so renderers don't rescan it per call."""
+    # Parsed field names are fresh strings; intern them to share the slot-name literals
+    return tuple(
+        (literal, sys.intern(field_name) if field_name is not None else None)
+        for literal, field_name, _, _ in _FORMATTER.parse(template)
+    )
+
+
+# Quick replies are read-only views shared across requests
+QuickReplies = Tuple[Mapping[str, str], ...]
+
+_YES_NO_REPLIES: QuickReplies = (
+    MappingProxyType({"label": "Yes", "value": "YES"}),
+    MappingProxyType({"label": "No", "value": "NO"}),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class Choice:
     """A choice option for CHOICE or YES_NO input types."""
     label: str
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SlotSpec:
     """
     Specification for a single slot to collect.
@@ -51,8 +82,6 @@ class SlotSpec:
         input_type: The type of input expected
         prompt: The question to ask the user for this slot
         choices: For CHOICE type, the available options
-        validators: Optional list of validator function names
-        normalizers: Optional list of normalizer function names
         description: Human-readable description for debugging
         ask_if: Optional predicate function that takes slots dict and returns bool.
                 If provided, this slot is only asked when ask_if(slots) returns True.
@@ -64,26 +93,32 @@ class SlotSpec:
     required: bool
     input_type: InputType
     prompt: str
-    choices: Optional[List[Choice]] = None
-    validators: Optional[List[str]] = None
-    normalizers: Optional[List[str]] = None
+    choices: Optional[Tuple[Choice, ...]] = None
     description: Optional[str] = None
     ask_if: Optional[Callable[[Dict[str, Any]], bool]] = None
     required_if: Optional[Callable[[Dict[str, Any]], bool]] = None
 
-    def get_quick_replies(self) -> Optional[List[Dict[str, str]]]:
+    # Quick replies are static per slot, precomputed once in __post_init__
+    _quick_replies: Optional[QuickReplies] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.choices is not None:
+            self.choices = tuple(self.choices)
+        if self.input_type == InputType.CHOICE and self.choices:
+            self._quick_replies = tuple(
+                MappingProxyType({"label": c.label, "value": c.value}) for c in self.choices
+            )
+        elif self.input_type == InputType.YES_NO:
+            self._quick_replies = _YES_NO_REPLIES
+        else:
+            self._quick_replies = None
+
+    def get_quick_replies(self) -> Optional[QuickReplies]:
         """
         Get quick replies for this slot based on input type.
-        Returns list of {label, value} dicts for UI chips.
+        Returns read-only {label, value} mappings for UI chips.
         """
-        if self.input_type == InputType.CHOICE and self.choices:
-            return [{"label": c.label, "value": c.value} for c in self.choices]
-        elif self.input_type == InputType.YES_NO:
-            return [
-                {"label": "Yes", "value": "YES"},
-                {"label": "No", "value": "NO"},
-            ]
-        return None
+        return self._quick_replies
 
     def should_ask(self, slots: Dict[str, Any]) -> bool:
         """
@@ -114,7 +149,7 @@ class SlotSpec:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class PhoneFlow:
     """Configuration for the live phone call."""
     mode: PhoneFlowMode
@@ -123,7 +158,7 @@ class PhoneFlow:
     system_prompt_template: Optional[str] = None  # For LLM_DIALOG
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentSpec:
     """
     Complete specification for an agent type.
@@ -157,28 +192,45 @@ class AgentSpec:
     place_query_slot: Optional[str] = None  # Slot to use for place search query
     place_area_slot: Optional[str] = None  # Slot to use for place search area
 
+    # Slot partitions and name index, precomputed once in __post_init__
+    _required: Tuple[SlotSpec, ...] = field(init=False, repr=False, compare=False)
+    _optional: Tuple[SlotSpec, ...] = field(init=False, repr=False, compare=False)
+    _by_name: Dict[str, SlotSpec] = field(init=False, repr=False, compare=False)
+    _names: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _required_names: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _confirm_plans: Tuple[TemplatePlan, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._required = tuple(s for s in self.slots_in_order if s.required)
+        self._optional = tuple(s for s in self.slots_in_order if not s.required)
+        self._by_name = {s.name: s for s in self.slots_in_order}
+        self._names = tuple(s.name for s in self.slots_in_order)
+        self._required_names = tuple(s.name for s in self._required)
+        self._confirm_plans = tuple(_compile_template(line) for line in self.confirm_lines)
+
     def get_required_slots(self) -> List[SlotSpec]:
         """Get all required slots in order."""
-        return [s for s in self.slots_in_order if s.required]
+        return list(self._required)
 
     def get_optional_slots(self) -> List[SlotSpec]:
         """Get all optional slots in order."""
-        return [s for s in self.slots_in_order if not s.required]
+        return list(self._optional)
 
     def get_slot_by_name(self, name: str) -> Optional[SlotSpec]:
         """Get a slot spec by name."""
-        for slot in self.slots_in_order:
-            if slot.name == name:
-                return slot
-        return None
+        return self._by_name.get(name)
 
     def get_slot_names(self) -> List[str]:
         """Get all slot names in order."""
-        return [s.name for s in self.slots_in_order]
+        return list(self._names)
 
     def get_required_slot_names(self) -> List[str]:
         """Get required slot names in order."""
-        return [s.name for s in self.slots_in_order if s.required]
+        return list(self._required_names)
+
+    def get_confirm_plans(self) -> Tuple[TemplatePlan, ...]:
+        """Get confirm_lines as precompiled template plans."""
+        return self._confirm_plans
 
 
 # =============================================================================
@@ -385,12 +437,12 @@ SICK_CALLER_SPEC = AgentSpec(
             required=True,
             input_type=InputType.CHOICE,
             prompt="What's the reason for calling in?",
-            choices=[
+            choices=(
                 Choice(label="I'm sick", value="SICK"),
                 Choice(label="Caring for someone", value="CARER"),
                 Choice(label="Mental health day", value="MENTAL_HEALTH"),
                 Choice(label="Medical appointment", value="MEDICAL_APPOINTMENT"),
-            ],
+            ),
             description="Reason category for absence"
         ),
         SlotSpec(
@@ -727,22 +779,28 @@ CANCEL_APPOINTMENT_SPEC = AgentSpec(
 # REGISTRY
 # =============================================================================
 
-AGENTS: Dict[str, AgentSpec] = {
+# Read-only view: the registry is fixed at import time (get_agent_spec memoizes on it)
+AGENTS: Mapping[str, AgentSpec] = MappingProxyType({
     "SICK_CALLER": SICK_CALLER_SPEC,
     "STOCK_CHECKER": STOCK_CHECKER_SPEC,
     "RESTAURANT_RESERVATION": RESTAURANT_RESERVATION_SPEC,
     "CANCEL_APPOINTMENT": CANCEL_APPOINTMENT_SPEC,
-}
+})
 
+_VALID_TYPES = tuple(AGENTS.keys())
 
+
+@lru_cache(maxsize=None)
 def get_agent_spec(agent_type: str) -> AgentSpec:
     """
     Get the AgentSpec for a given agent type.
 
+    The registry is static, so lookups are memoized (misses raise and are not cached).
+
     Raises:
         ValueError: If agent type is not found in registry.
     """
     spec = AGENTS.get(agent_type)
     if spec is None:
-        raise ValueError(f"Unknown agent type: {agent_type}. Valid types: {list(AGENTS.keys())}")
+        raise ValueError(f"Unknown agent type: {agent_type}. Valid types: {list(_VALID_TYPES)}")
     return spec
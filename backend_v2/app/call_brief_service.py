@@ -5,18 +5,20 @@ This service:
 1. Deterministically checks for missing required fields (NOT OpenAI)
 2. Calls OpenAI to generate objective, scriptPreview, and checklist
 3. Never caches - always calls OpenAI
-
-Python 3.9 compatible - uses typing.Dict, typing.List, typing.Optional, typing.Tuple
 """
 
-import json
 import logging
 import os
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from functools import cached_property, lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
+import orjson
 from openai import AsyncOpenAI
 
+from agents import AGENTS
+
 from .models import (
     CallBriefDisclosure,
     CallBriefFallbacks,
@@ -35,13 +37,51 @@ CHAIN_RETAILERS = [
     "masters", "mitre 10", "home hardware"
 ]
 
+# Single-word chains are matched as whole tokens (O(1) set lookup per token);
+# multi-word chains go through one word-bounded alternation regex.
+# Whole-word matching avoids false positives like "target" in "supertargeted".
+_CHAIN_TOKENS = frozenset(c for c in CHAIN_RETAILERS if " " not in c)
+_CHAIN_MULTI_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(c) for c in CHAIN_RETAILERS if " " in c) + r")\b",
+    re.IGNORECASE,
+)
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=1024)
+def _is_chain_name(retailer_name: str) -> bool:
+    # Bounded memo: the same retailer is checked several times per request
+    if not _CHAIN_TOKENS.isdisjoint(_TOKEN_RE.findall(retailer_name.lower())):
+        return True
+    return _CHAIN_MULTI_RE.search(retailer_name) is not None
+
 
 def is_chain_retailer(retailer_name: str) -> bool:
     """Check if a retailer is a chain (requires store_location)."""
     if not retailer_name:
         return False
-    normalized = retailer_name.lower().strip()
-    return any(chain in normalized for chain in CHAIN_RETAILERS)
+    return _is_chain_name(retailer_name)
+
+
+# Spec-required slots the brief treats differently:
+# - STOCK_CHECKER quantity defaults to 1, and store_location is only required for chains
+_BRIEF_DEFERRED_SLOTS: Dict[str, FrozenSet[str]] = {
+    "STOCK_CHECKER": frozenset({"quantity", "store_location"}),
+}
+# Slots that can be satisfied by an alternative slot
+_BRIEF_ALTERNATIVE_SLOTS: Dict[str, str] = {
+    "shift_start_time": "shift_descriptor",
+}
+
+# Per agent type: (required slot, alternative slot or None), derived once from AGENTS
+_BRIEF_REQUIRED_FIELDS: Dict[str, Tuple[Tuple[str, Optional[str]], ...]] = {
+    agent_type: tuple(
+        (name, _BRIEF_ALTERNATIVE_SLOTS.get(name))
+        for name in spec.get_required_slot_names()
+        if name not in _BRIEF_DEFERRED_SLOTS.get(agent_type, ())
+    )
+    for agent_type, spec in AGENTS.items()
+}
 
 
 def compute_missing_required_fields(
@@ -52,74 +92,20 @@ def compute_missing_required_fields(
     Deterministically compute which required fields are missing.
     This does NOT call OpenAI - it's pure logic.
 
-    Uses AgentSpec for the required slots definition, with legacy fallback.
+    Uses the AgentSpec required slots, minus the brief-level exceptions above.
     """
-    # Try to use AgentSpec (new approach)
-    try:
-        from backend_v2.agents import get_agent_spec
-        from backend_v2.engine.planner import get_missing_required_slots
-        spec = get_agent_spec(agent_type)
-        return get_missing_required_slots(spec, slots)
-    except (ImportError, ValueError):
-        # Fallback to legacy logic
-        pass
-
-    missing: List[str] = []
+    missing = [
+        name
+        for name, alternative in _BRIEF_REQUIRED_FIELDS.get(agent_type, ())
+        if not slots.get(name) and not (alternative and slots.get(alternative))
+    ]
 
+    # Conditionally required: store_location for chain retailers
     if agent_type == "STOCK_CHECKER":
-        # Required: retailer_name, product_name, quantity (defaults to 1)
-        if not slots.get("retailer_name"):
-            missing.append("retailer_name")
-        if not slots.get("product_name"):
-            missing.append("product_name")
-        # quantity defaults to 1, so only missing if explicitly null
-        if slots.get("quantity") is None and "quantity" not in slots:
-            # If quantity not in slots at all, it's OK - will default to 1
-            pass
-
-        # Conditionally required: store_location for chain retailers
         retailer = slots.get("retailer_name", "")
         if is_chain_retailer(retailer) and not slots.get("store_location"):
             missing.append("store_location")
 
-    elif agent_type == "RESTAURANT_RESERVATION":
-        # Required: restaurant_name, party_size, date, time
-        if not slots.get("restaurant_name"):
-            missing.append("restaurant_name")
-        if not slots.get("party_size"):
-            missing.append("party_size")
-        if not slots.get("date"):
-            missing.append("date")
-        if not slots.get("time"):
-            missing.append("time")
-
-    elif agent_type == "SICK_CALLER":
-        # Required: employer_name, employer_phone, caller_name, shift_date, shift_start_time OR shift_descriptor, reason_category
-        if not slots.get("employer_name"):
-            missing.append("employer_name")
-        if not slots.get("employer_phone"):
-            missing.append("employer_phone")
-        if not slots.get("caller_name"):
-            missing.append("caller_name")
-        if not slots.get("shift_date"):
-            missing.append("shift_date")
-        # Either shift_start_time or shift_descriptor is required
-        if not slots.get("shift_start_time") and not slots.get("shift_descriptor"):
-            missing.append("shift_start_time")
-        if not slots.get("reason_category"):
-            missing.append("reason_category")
-
-    elif agent_type == "CANCEL_APPOINTMENT":
-        # Required: business_name, appointment_day, appointment_time, customer_name
-        if not slots.get("business_name"):
-            missing.append("business_name")
-        if not slots.get("appointment_day"):
-            missing.append("appointment_day")
-        if not slots.get("appointment_time"):
-            missing.append("appointment_time")
-        if not slots.get("customer_name"):
-            missing.append("customer_name")
-
     return missing
 
 
@@ -128,10 +114,12 @@ def validate_phone_e164(phone: str) -> bool:
     Validate E.164 phone format: starts with +, followed by digits only.
     Examples: +61731824583, +14155551234
     """
-    if not phone:
+    # Equivalent to ^\+[1-9]\d{6,14}$ without entering the regex engine.
+    # isascii() keeps non-ASCII digits (e.g. "٣", "²") out since isdigit() accepts them.
+    if not phone or not 8 <= len(phone) <= 16 or phone[0] != "+" or phone[1] == "0":
         return False
-    pattern = r'^\+[1-9]\d{6,14}$'
-    return bool(re.match(pattern, phone))
+    digits = phone[1:]
+    return digits.isascii() and digits.isdigit()
 
 
 CALL_BRIEF_SYSTEM_PROMPT = """You are generating a call script preview for Calleroo, an AI assistant that makes phone calls on behalf of users.
@@ -173,6 +161,42 @@ RESPONSE FORMAT (JSON only, no markdown):
 }"""
 
 
+# Static request parts, shared across calls (the SDK only reads them)
+_SYSTEM_MESSAGE: Dict[str, str] = {"role": "system", "content": CALL_BRIEF_SYSTEM_PROMPT}
+_JSON_RESPONSE_FORMAT: Dict[str, str] = {"type": "json_object"}
+
+# Fixed-shape context message; fallback lines are appended via the last %s
+_CONTEXT_TEMPLATE = (
+    "Agent Type: %s\n"
+    "\n"
+    "Place:\n"
+    "  Business Name: %s\n"
+    "  Address: %s\n"
+    "  Phone: %s\n"
+    "\n"
+    "Slots: %s\n"
+    "\n"
+    "Disclosure:\n"
+    "  Share my name: %s\n"
+    "  Share my phone: %s\n"
+    "\n"
+    "Fallbacks:%s"
+)
+
+# Fallback lines per agent type: (CallBriefFallbacks attribute, context label)
+_FALLBACK_LINES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "STOCK_CHECKER": (
+        ("askETA", "  Ask for ETA if out of stock: "),
+        ("askNearestStore", "  Ask about nearest store: "),
+    ),
+    "RESTAURANT_RESERVATION": (
+        ("retryIfNoAnswer", "  Retry if no answer: "),
+        ("retryIfBusy", "  Retry if busy: "),
+        ("leaveVoicemail", "  Leave voicemail: "),
+    ),
+}
+
+
 class CallBriefService:
     """Service for generating call briefs via OpenAI."""
 
@@ -181,10 +205,15 @@ class CallBriefService:
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY is required")
 
-        self.client = AsyncOpenAI(api_key=api_key)
+        self._api_key = api_key
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         logger.info(f"CallBriefService configured with model: {self.model}")
 
+    @cached_property
+    def client(self) -> AsyncOpenAI:
+        """OpenAI client, created on first generate_brief rather than at startup."""
+        return AsyncOpenAI(api_key=self._api_key)
+
     async def generate_brief(
         self,
         agent_type: str,
@@ -212,10 +241,8 @@ class CallBriefService:
         # Build context message
         context = self._build_context(agent_type, place, slots, disclosure, fallbacks)
 
-        messages = [
-            {"role": "system", "content": CALL_BRIEF_SYSTEM_PROMPT},
-            {"role": "user", "content": context},
-        ]
+        # The SDK accepts any iterable of messages; a tuple avoids building a list per call
+        messages = (_SYSTEM_MESSAGE, {"role": "user", "content": context})
 
         logger.info(f"Calling OpenAI ({self.model}) for call brief generation")
 
@@ -224,7 +251,7 @@ class CallBriefService:
             messages=messages,
             temperature=0.7,
             max_tokens=1000,
-            response_format={"type": "json_object"},
+            response_format=_JSON_RESPONSE_FORMAT,
         )
 
         content = response.choices[0].message.content
@@ -241,38 +268,23 @@ class CallBriefService:
         fallbacks: CallBriefFallbacks,
     ) -> str:
         """Build context message for OpenAI."""
-        parts = [
-            f"Agent Type: {agent_type}",
-            "",
-            "Place:",
-            f"  Business Name: {place.businessName}",
-            f"  Address: {place.formattedAddress or 'Not provided'}",
-            f"  Phone: {place.phoneE164}",
-            "",
-            f"Slots: {json.dumps(slots)}",
-            "",
-            "Disclosure:",
-            f"  Share my name: {disclosure.nameShare}",
-            f"  Share my phone: {disclosure.phoneShare}",
-            "",
-            "Fallbacks:",
-        ]
-
         # Add relevant fallbacks based on agent type
-        if agent_type == "STOCK_CHECKER":
-            if fallbacks.askETA is not None:
-                parts.append(f"  Ask for ETA if out of stock: {fallbacks.askETA}")
-            if fallbacks.askNearestStore is not None:
-                parts.append(f"  Ask about nearest store: {fallbacks.askNearestStore}")
-        elif agent_type == "RESTAURANT_RESERVATION":
-            if fallbacks.retryIfNoAnswer is not None:
-                parts.append(f"  Retry if no answer: {fallbacks.retryIfNoAnswer}")
-            if fallbacks.retryIfBusy is not None:
-                parts.append(f"  Retry if busy: {fallbacks.retryIfBusy}")
-            if fallbacks.leaveVoicemail is not None:
-                parts.append(f"  Leave voicemail: {fallbacks.leaveVoicemail}")
-
-        return "\n".join(parts)
+        fallback_text = "".join(
+            f"\n{label}{value}"
+            for attr, label in _FALLBACK_LINES.get(agent_type, ())
+            if (value := getattr(fallbacks, attr)) is not None
+        )
+
+        return _CONTEXT_TEMPLATE % (
+            agent_type,
+            place.businessName,
+            place.formattedAddress or "Not provided",
+            place.phoneE164,
+            orjson.dumps(slots).decode(),
+            disclosure.nameShare,
+            disclosure.phoneShare,
+            fallback_text,
+        )
 
     def _parse_response(self, content: Optional[str]) -> Tuple[str, str, List[str]]:
         """Parse OpenAI JSON response into components."""
@@ -280,8 +292,8 @@ class CallBriefService:
             raise ValueError("OpenAI returned empty response")
 
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError as e:
             logger.error(f"invalid_openai_json: Failed to parse call brief response: {content[:500]}")
             raise ValueError(f"invalid_openai_json: OpenAI returned invalid JSON: {str(e)}")
 
@@ -301,11 +313,14 @@ class CallBriefService:
 
 # Singleton instance (created on first import when needed)
 _call_brief_service: Optional[CallBriefService] = None
+_call_brief_service_lock = threading.Lock()
 
 
 def get_call_brief_service() -> CallBriefService:
     """Get or create the CallBriefService singleton."""
     global _call_brief_service
     if _call_brief_service is None:
-        _call_brief_service = CallBriefService()
+        with _call_brief_service_lock:
+            if _call_brief_service is None:
+                _call_brief_service = CallBriefService()
     return _call_brief_service
@@ -2,7 +2,6 @@
 Call Result Service - Formats call results for UI display.
 
 Uses OpenAI to generate user-friendly summaries of call outcomes.
-Python 3.9 compatible.
 """
 
 import json
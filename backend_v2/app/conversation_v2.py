@@ -9,13 +9,18 @@ This module provides a new /v2/conversation/next endpoint that:
 
 The existing /conversation/next endpoint is preserved for backwards compatibility.
 """
+import asyncio
 import logging
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from itertools import islice
+import time
 from typing import Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
 
 from fastapi import HTTPException
 
 from .models import (
+    Choice,
     ClientAction,
     Confidence,
     ConversationRequest,
@@ -31,6 +36,8 @@ from .models import (
 )
 from agents import get_agent_spec, AgentSpec, PhoneSource
 from engine.planner import (
+    build_confirmation_card,
+    build_question,
     decide_next_action,
     get_missing_required_slots,
     NextAction as PlannerNextAction,
@@ -41,6 +48,24 @@ from engine.extract import extract_slots, ExtractionResult
 
 logger = logging.getLogger(__name__)
 
+# Planner -> API enum mappings (built once, used on every turn)
+_PLANNER_ACTION_MAP: Dict[PlannerNextAction, NextAction] = {
+    PlannerNextAction.ASK_QUESTION: NextAction.ASK_QUESTION,
+    PlannerNextAction.CONFIRM: NextAction.CONFIRM,
+    PlannerNextAction.COMPLETE: NextAction.COMPLETE,
+    PlannerNextAction.FIND_PLACE: NextAction.FIND_PLACE,
+}
+
+_INPUT_TYPE_MAP: Dict[str, InputType] = {
+    "TEXT": InputType.TEXT,
+    "PHONE": InputType.PHONE,
+    "DATE": InputType.DATE,
+    "TIME": InputType.TIME,
+    "NUMBER": InputType.NUMBER,
+    "CHOICE": InputType.CHOICE,
+    "YES_NO": InputType.YES_NO,
+}
+
 
 def _log_turn_summary(
     conversation_id: str,
@@ -62,20 +87,28 @@ def _log_turn_summary(
     - ai_call_made: Whether LLM was invoked
     """
     logger.info(
-        "[V2-SUMMARY] "
-        f"id={conversation_id} "
-        f"agent={agent_type} "
-        f"action={next_action} "
-        f"question={question_slot or 'none'} "
-        f"slots_filled={slots_filled} "
-        f"ai_used={ai_call_made}"
+        "[V2-SUMMARY] id=%s agent=%s action=%s question=%s slots_filled=%s ai_used=%s",
+        conversation_id,
+        agent_type,
+        next_action,
+        question_slot or "none",
+        slots_filled,
+        ai_call_made,
     )
 
 
 # Idempotency store for preventing duplicate confirmations
-# Key: idempotencyKey, Value: (response, timestamp)
-_idempotency_store_v2: Dict[str, Tuple[ConversationResponse, datetime]] = {}
-_IDEMPOTENCY_TTL = timedelta(minutes=5)
+# Key: idempotencyKey, Value: (response, time.monotonic() timestamp)
+# Kept in insertion order (oldest first) so eviction pops from the front in O(1)
+_idempotency_store_v2: "OrderedDict[str, Tuple[ConversationResponse, float]]" = OrderedDict()
+_IDEMPOTENCY_TTL_S = 300.0
+_IDEMPOTENCY_MAX_ENTRIES = 1000
+_IDEMPOTENCY_SWEEP_BATCH = 4
+
+# Turns currently being processed, by idempotencyKey. A duplicate that arrives
+# while the first is still awaiting extraction waits for its result instead of
+# racing it (the store above only helps once the first turn has finished).
+_idempotency_inflight_v2: Dict[str, "asyncio.Future[Optional[ConversationResponse]]"] = {}
 
 
 # =============================================================================
@@ -97,17 +130,19 @@ class _V2Metrics:
         self.deterministic_only = 0
         self.fallback_used = 0
         self.idempotency_hits = 0
-        self.confirm_actions = 0
-        self.reject_actions = 0
-        self.complete_actions = 0
-        self.find_place_actions = 0
-        self.ask_question_actions = 0
+        # Per-action counts, keyed by the planner's NextAction value
+        self.actions: Counter = Counter()
         # Anomaly detection
         self.consecutive_fallbacks = 0
         self.max_consecutive_fallbacks = 0
 
-    def record_request(self, llm_used: bool, next_action: str, fallback: bool = False):
-        """Record metrics for a completed request."""
+    def record_request(self, llm_used: bool, next_action: PlannerNextAction, fallback: bool = False):
+        """
+        Record metrics for a completed request.
+
+        next_action is the planner enum; as a str Enum it hashes and compares like its
+        value, so the "CONFIRM"/... lookups in the properties below find it directly.
+        """
         self.total_requests += 1
 
         if llm_used:
@@ -132,17 +167,28 @@ class _V2Metrics:
             self.consecutive_fallbacks = 0
 
         # Track action distribution
-        action_upper = next_action.upper() if next_action else ""
-        if action_upper == "CONFIRM":
-            self.confirm_actions += 1
-        elif action_upper == "COMPLETE":
-            self.complete_actions += 1
-        elif action_upper == "FIND_PLACE":
-            self.find_place_actions += 1
-        elif action_upper == "ASK_QUESTION":
-            self.ask_question_actions += 1
-        elif action_upper == "REJECT":
-            self.reject_actions += 1
+        if next_action:
+            self.actions[next_action] += 1
+
+    @property
+    def confirm_actions(self) -> int:
+        return self.actions["CONFIRM"]
+
+    @property
+    def reject_actions(self) -> int:
+        return self.actions["REJECT"]
+
+    @property
+    def complete_actions(self) -> int:
+        return self.actions["COMPLETE"]
+
+    @property
+    def find_place_actions(self) -> int:
+        return self.actions["FIND_PLACE"]
+
+    @property
+    def ask_question_actions(self) -> int:
+        return self.actions["ASK_QUESTION"]
 
     def record_idempotency_hit(self):
         """Record an idempotency cache hit."""
@@ -175,30 +221,44 @@ _metrics = _V2Metrics()
 
 def _get_idempotent_response(key: str) -> Optional[ConversationResponse]:
     """Get cached response for idempotency key if still valid."""
-    if key in _idempotency_store_v2:
-        response, timestamp = _idempotency_store_v2[key]
-        if datetime.now() - timestamp < _IDEMPOTENCY_TTL:
-            logger.info(f"Idempotency hit for key={key}")
+    now = time.monotonic()
+    _sweep_expired_idempotency(now)
+    entry = _idempotency_store_v2.get(key)
+    if entry is not None:
+        response, timestamp = entry
+        if now - timestamp < _IDEMPOTENCY_TTL_S:
+            logger.info("Idempotency hit for key=%s", key)
             return response
-        else:
-            del _idempotency_store_v2[key]
+        del _idempotency_store_v2[key]
     return None
 
 
-def _store_idempotent_response(key: str, response: ConversationResponse) -> None:
-    """Store response for idempotency."""
-    _idempotency_store_v2[key] = (response, datetime.now())
-    # Cleanup old entries
-    if len(_idempotency_store_v2) > 1000:
-        cutoff = datetime.now() - _IDEMPOTENCY_TTL
-        keys_to_remove = [k for k, (_, ts) in _idempotency_store_v2.items() if ts < cutoff]
-        for k in keys_to_remove:
-            del _idempotency_store_v2[k]
+def _sweep_expired_idempotency(now: float) -> None:
+    """Drop up to a small batch of the oldest entries if they have expired."""
+    cutoff = now - _IDEMPOTENCY_TTL_S
+    for k, (_, ts) in list(islice(_idempotency_store_v2.items(), _IDEMPOTENCY_SWEEP_BATCH)):
+        if ts >= cutoff:
+            break
+        del _idempotency_store_v2[k]
 
 
+def _store_idempotent_response(key: str, response: ConversationResponse) -> None:
+    """Store response for idempotency."""
+    now = time.monotonic()
+    _idempotency_store_v2.pop(key, None)
+    _idempotency_store_v2[key] = (response, now)
+    _sweep_expired_idempotency(now)
+    # Evict oldest entries beyond the cap
+    while len(_idempotency_store_v2) > _IDEMPOTENCY_MAX_ENTRIES:
+        _idempotency_store_v2.popitem(last=False)
+
+
+# Planner/spec outputs are already well-typed, so the API models below are built
+# with model_construct (no re-validation). FastAPI still validates the response_model
+# on the way out; the error fallbacks keep full validation.
 def _build_agent_meta(spec: AgentSpec) -> AgentMeta:
     """Build AgentMeta from AgentSpec."""
-    return AgentMeta(
+    return AgentMeta.model_construct(
         phoneSource=spec.phone_source.value,
         directPhoneSlot=spec.direct_phone_slot,
         title=spec.title,
@@ -206,37 +266,38 @@ def _build_agent_meta(spec: AgentSpec) -> AgentMeta:
     )
 
 
+@lru_cache(maxsize=32)
+def _spec_and_meta(agent_type: str) -> Tuple[AgentSpec, AgentMeta]:
+    """Get the AgentSpec and its AgentMeta; both are static per agent type."""
+    spec = get_agent_spec(agent_type)
+    return spec, _build_agent_meta(spec)
+
+
+@lru_cache(maxsize=32)
+def _empty_reject_result(agent_type: str) -> PlannerResult:
+    """Planner result for REJECT with no slots yet - depends only on the spec."""
+    spec, _ = _spec_and_meta(agent_type)
+    return decide_next_action(spec=spec, slots={}, client_action="REJECT")
+
+
 def _planner_to_api_question(planner_question) -> Optional[Question]:
     """Convert planner Question to API Question model."""
     if planner_question is None:
         return None
 
+    input_type = _INPUT_TYPE_MAP.get(planner_question.input_type, InputType.TEXT)
+
+    # Build quickReplies and legacy choices from the same pass over the planner replies
     quick_replies = None
-    if planner_question.quick_replies:
-        quick_replies = [
-            QuickReply(label=qr.label, value=qr.value)
-            for qr in planner_question.quick_replies
-        ]
-
-    # Map input types
-    input_type_map = {
-        "TEXT": InputType.TEXT,
-        "PHONE": InputType.PHONE,
-        "DATE": InputType.DATE,
-        "TIME": InputType.TIME,
-        "NUMBER": InputType.NUMBER,
-        "CHOICE": InputType.CHOICE,
-        "YES_NO": InputType.YES_NO,
-    }
-    input_type = input_type_map.get(planner_question.input_type, InputType.TEXT)
-
-    # Also populate choices for legacy compatibility
     choices = None
-    if quick_replies:
-        from .models import Choice
-        choices = [Choice(label=qr.label, value=qr.value) for qr in quick_replies]
+    if planner_question.quick_replies:
+        quick_replies = []
+        choices = []
+        for qr in planner_question.quick_replies:
+            quick_replies.append(QuickReply.model_construct(label=qr.label, value=qr.value))
+            choices.append(Choice.model_construct(label=qr.label, value=qr.value))
 
-    return Question(
+    return Question.model_construct(
         text=planner_question.prompt,
         field=planner_question.slot_name,
         inputType=input_type,
@@ -251,7 +312,7 @@ def _planner_to_api_confirmation_card(planner_card) -> Optional[ConfirmationCard
     if planner_card is None:
         return None
 
-    return ConfirmationCard(
+    return ConfirmationCard.model_construct(
         title=planner_card.title,
         lines=planner_card.lines,
         confirmLabel=planner_card.confirm_label,
@@ -260,30 +321,92 @@ def _planner_to_api_confirmation_card(planner_card) -> Optional[ConfirmationCard
     )
 
 
-def _planner_to_api_place_search_params(planner_params) -> Optional[PlaceSearchParams]:
-    """Convert planner PlaceSearchParams to API PlaceSearchParams model."""
-    if planner_params is None:
-        return None
-
-    return PlaceSearchParams(
-        query=planner_params.query,
-        area=planner_params.area,
-        country="AU",
+def _build_response_from_planner(
+    planner_result: PlannerResult,
+    slots: Dict[str, Any],
+    agent_meta: AgentMeta,
+    confidence: Confidence = Confidence.HIGH,
+    ai_call_made: bool = False,
+    ai_model: str = "deterministic",
+    debug_payload: Optional[DebugPayload] = None,
+) -> ConversationResponse:
+    """Build the API response for a planner decision (CONFIRM, REJECT and normal turns)."""
+    question = planner_result.question
+    card = planner_result.confirmation_card
+    params = planner_result.place_search_params
+    return ConversationResponse.model_construct(
+        assistantMessage=planner_result.assistant_message,
+        nextAction=_PLANNER_ACTION_MAP[planner_result.next_action],
+        question=_planner_to_api_question(question) if question is not None else None,
+        extractedData=slots,
+        confidence=confidence,
+        confirmationCard=_planner_to_api_confirmation_card(card) if card is not None else None,
+        placeSearchParams=(
+            PlaceSearchParams.model_construct(query=params.query, area=params.area, country="AU")
+            if params is not None else None
+        ),
+        agentMeta=agent_meta,  # ALWAYS present
+        aiCallMade=ai_call_made,
+        aiModel=ai_model,
+        engineVersion="v2",
+        debugPayload=debug_payload,
     )
 
 
-def _planner_action_to_api_action(planner_action: PlannerNextAction) -> NextAction:
-    """Convert planner NextAction to API NextAction."""
-    mapping = {
-        PlannerNextAction.ASK_QUESTION: NextAction.ASK_QUESTION,
-        PlannerNextAction.CONFIRM: NextAction.CONFIRM,
-        PlannerNextAction.COMPLETE: NextAction.COMPLETE,
-        PlannerNextAction.FIND_PLACE: NextAction.FIND_PLACE,
-    }
-    return mapping[planner_action]
+async def process_conversation_v2(
+    request: ConversationRequest,
+    openai_client: Any = None,
+    model: str = "gpt-4o-mini",
+) -> ConversationResponse:
+    """
+    Process a conversation turn, coalescing concurrent duplicates by idempotencyKey.
 
+    See _process_turn_v2 for the turn flow.
+    """
+    key = request.idempotencyKey
+    if not key:
+        return await _process_turn_or_fallback(request, openai_client, model)
+
+    pending = _idempotency_inflight_v2.get(key)
+    if pending is not None:
+        logger.info("[V2] Idempotency key in flight, awaiting first turn: %s", key)
+        cached = await asyncio.shield(pending)
+        if cached is not None:
+            _metrics.record_idempotency_hit()
+            return cached
+        # First turn failed - process this one normally rather than sharing its fallback
+        return await _process_turn_or_fallback(request, openai_client, model)
+
+    future: "asyncio.Future[Optional[ConversationResponse]]" = asyncio.get_running_loop().create_future()
+    _idempotency_inflight_v2[key] = future
+    response = None
+    try:
+        response = await _process_turn_v2(request, openai_client, model)
+        return response
+    except _TurnFailed:
+        return _create_fallback_response(request)
+    finally:
+        del _idempotency_inflight_v2[key]
+        future.set_result(response)
 
-async def process_conversation_v2(
+
+class _TurnFailed(Exception):
+    """Raised by _process_turn_v2 when the turn hit an unexpected error (already logged)."""
+
+
+async def _process_turn_or_fallback(
+    request: ConversationRequest,
+    openai_client: Any = None,
+    model: str = "gpt-4o-mini",
+) -> ConversationResponse:
+    """Run a turn, returning the safe fallback response if it fails."""
+    try:
+        return await _process_turn_v2(request, openai_client, model)
+    except _TurnFailed:
+        return _create_fallback_response(request)
+
+
+async def _process_turn_v2(
     request: ConversationRequest,
     openai_client: Any = None,
     model: str = "gpt-4o-mini",
@@ -291,7 +414,7 @@ async def process_conversation_v2(
     """
     Process a conversation turn using the new engine.
 
-    This is the main entry point for the v2 conversation handler.
+    Called via process_conversation_v2, the entry point for the v2 handler.
 
     Flow:
     1. Check idempotency
@@ -310,35 +433,42 @@ async def process_conversation_v2(
 
     Returns:
         ConversationResponse with the next action and data
+
+    Raises:
+        _TurnFailed: on an unexpected error; the caller returns the fallback response
     """
-    msg_preview = request.userMessage[:50] + "..." if len(request.userMessage) > 50 else request.userMessage
-    logger.info(
-        f"[V2] Conversation turn: id={request.conversationId}, "
-        f"agent={request.agentType}, "
-        f"clientAction={request.clientAction}, "
-        f"currentSlot={request.currentQuestionSlotName}, "
-        f"message='{msg_preview}'"
-    )
+    # Hot-path logs use lazy %-args (or an isEnabledFor guard) so nothing is formatted
+    # when INFO is filtered out
+    if logger.isEnabledFor(logging.INFO):
+        msg = request.userMessage
+        msg_preview = msg if len(msg) <= 50 else msg[:50] + "..."
+        logger.info(
+            f"[V2] Conversation turn: id={request.conversationId}, "
+            f"agent={request.agentType}, "
+            f"clientAction={request.clientAction}, "
+            f"currentSlot={request.currentQuestionSlotName}, "
+            f"message='{msg_preview}'"
+        )
 
     try:
         # Get AgentSpec
-        spec = get_agent_spec(request.agentType.value)
-        agent_meta = _build_agent_meta(spec)
+        agent_type_value = request.agentType.value
+        spec, agent_meta = _spec_and_meta(agent_type_value)
 
         # Idempotency check
         if request.idempotencyKey:
             cached = _get_idempotent_response(request.idempotencyKey)
             if cached:
-                logger.info(f"[V2] Idempotency hit: {request.idempotencyKey}")
+                logger.info("[V2] Idempotency hit: %s", request.idempotencyKey)
                 _metrics.record_idempotency_hit()
                 return cached
 
-        # Get existing slots
-        existing_slots = request.slots if request.slots else {}
+        # Get existing slots (ConversationRequest.slots defaults to a fresh dict, never None)
+        existing_slots = request.slots
 
         # Handle CONFIRM action - use planner to decide FIND_PLACE vs COMPLETE
         if request.clientAction == ClientAction.CONFIRM:
-            logger.info(f"[V2] Client action: CONFIRM")
+            logger.info("[V2] Client action: CONFIRM")
 
             # Run planner to decide next action (handles place resolution check)
             planner_result = decide_next_action(
@@ -354,52 +484,39 @@ async def process_conversation_v2(
             # This prevents showing another confirmation after place selection
             if planner_result.next_action == PlannerNextAction.FIND_PLACE:
                 response_slots[CONFIRMED_DETAILS_FLAG] = True
-                logger.info(f"[V2] CONFIRM => FIND_PLACE, setting {CONFIRMED_DETAILS_FLAG}=true")
-
-            response = ConversationResponse(
-                assistantMessage=planner_result.assistant_message,
-                nextAction=_planner_action_to_api_action(planner_result.next_action),
-                question=None,
-                extractedData=response_slots,  # Preserve all slots + flag
-                confidence=Confidence.HIGH,
-                confirmationCard=None,
-                placeSearchParams=_planner_to_api_place_search_params(planner_result.place_search_params),
-                agentMeta=agent_meta,  # ALWAYS present
-                aiCallMade=False,
-                aiModel="deterministic",
-                engineVersion="v2",
+                logger.info("[V2] CONFIRM => FIND_PLACE, setting %s=true", CONFIRMED_DETAILS_FLAG)
+
+            response = _build_response_from_planner(
+                planner_result,
+                response_slots,  # Preserve all slots + flag
+                agent_meta,
             )
             if request.idempotencyKey:
                 _store_idempotent_response(request.idempotencyKey, response)
-            _metrics.record_request(llm_used=False, next_action=planner_result.next_action.value)
+            _metrics.record_request(llm_used=False, next_action=planner_result.next_action)
             return response
 
         # Handle REJECT action deterministically
         if request.clientAction == ClientAction.REJECT:
-            logger.info(f"[V2] Client action: REJECT")
-            # Run planner to get next question
-            planner_result = decide_next_action(
-                spec=spec,
-                slots=existing_slots,
-                client_action="REJECT",
-            )
+            logger.info("[V2] Client action: REJECT")
+            # Run planner to get next question (static when nothing has been collected yet)
+            if existing_slots:
+                planner_result = decide_next_action(
+                    spec=spec,
+                    slots=existing_slots,
+                    client_action="REJECT",
+                )
+            else:
+                planner_result = _empty_reject_result(spec.agent_type)
 
-            response = ConversationResponse(
-                assistantMessage=planner_result.assistant_message,
-                nextAction=_planner_action_to_api_action(planner_result.next_action),
-                question=_planner_to_api_question(planner_result.question),
-                extractedData=existing_slots,  # Preserve all slots
-                confidence=Confidence.HIGH,
-                confirmationCard=None,
-                placeSearchParams=None,
-                agentMeta=agent_meta,  # ALWAYS present
-                aiCallMade=False,
-                aiModel="deterministic",
-                engineVersion="v2",
+            response = _build_response_from_planner(
+                planner_result,
+                existing_slots,  # Preserve all slots
+                agent_meta,
             )
             if request.idempotencyKey:
                 _store_idempotent_response(request.idempotencyKey, response)
-            _metrics.record_request(llm_used=False, next_action=planner_result.next_action.value)
+            _metrics.record_request(llm_used=False, next_action=planner_result.next_action)
             return response
 
         # Normal flow: extract slots and run planner
@@ -415,12 +532,18 @@ async def process_conversation_v2(
         )
 
         logger.info(
-            f"[V2] Extraction: extracted={extraction_result.extracted_data}, "
-            f"llm_used={extraction_result.llm_used}"
+            "[V2] Extraction: extracted=%s, llm_used=%s",
+            extraction_result.extracted_data,
+            extraction_result.llm_used,
         )
 
         # Step 2: Merge extracted slots with existing
-        merged_slots = {**existing_slots, **extraction_result.extracted_data}
+        # The response returns the full merged dict anyway, so a lazy ChainMap view would
+        # only defer the copy; skip it entirely when nothing new was extracted.
+        if extraction_result.extracted_data:
+            merged_slots = {**existing_slots, **extraction_result.extracted_data}
+        else:
+            merged_slots = existing_slots
 
         # Step 3: Run deterministic planner
         planner_result = decide_next_action(
@@ -430,18 +553,17 @@ async def process_conversation_v2(
             user_message=request.userMessage,
             current_question_slot=request.currentQuestionSlotName,
         )
+        action_value = planner_result.next_action.value
+        question_slot = planner_result.question.slot_name if planner_result.question else None
 
-        logger.info(
-            f"[V2] Planner: action={planner_result.next_action}, "
-            f"question={planner_result.question.slot_name if planner_result.question else None}"
-        )
+        logger.info("[V2] Planner: action=%s, question=%s", action_value, question_slot)
 
         # Step 4: Build debug payload if requested (6.3)
         debug_payload = None
         if request.debug:
             debug_payload = DebugPayload(
-                planner_action=planner_result.next_action.value,
-                planner_question_slot=planner_result.question.slot_name if planner_result.question else None,
+                planner_action=action_value,
+                planner_question_slot=question_slot,
                 extraction_llm_used=extraction_result.llm_used,
                 extraction_raw_data=extraction_result.extracted_data,
                 merged_slots=merged_slots,
@@ -449,19 +571,14 @@ async def process_conversation_v2(
             )
 
         # Step 5: Build response
-        response = ConversationResponse(
-            assistantMessage=planner_result.assistant_message,
-            nextAction=_planner_action_to_api_action(planner_result.next_action),
-            question=_planner_to_api_question(planner_result.question),
-            extractedData=merged_slots,  # CRITICAL: Return FULL merged slots
+        response = _build_response_from_planner(
+            planner_result,
+            merged_slots,  # CRITICAL: Return FULL merged slots
+            agent_meta,
             confidence=Confidence.HIGH if not extraction_result.llm_used else Confidence.MEDIUM,
-            confirmationCard=_planner_to_api_confirmation_card(planner_result.confirmation_card),
-            placeSearchParams=_planner_to_api_place_search_params(planner_result.place_search_params),
-            agentMeta=agent_meta,  # ALWAYS present
-            aiCallMade=extraction_result.llm_used,
-            aiModel=extraction_result.llm_model or "deterministic",
-            engineVersion="v2",
-            debugPayload=debug_payload,  # Only present when debug=true
+            ai_call_made=extraction_result.llm_used,
+            ai_model=extraction_result.llm_model or "deterministic",
+            debug_payload=debug_payload,  # Only present when debug=true
         )
 
         if request.idempotencyKey:
@@ -470,9 +587,9 @@ async def process_conversation_v2(
         # 6.1 Structured summary log
         _log_turn_summary(
             conversation_id=request.conversationId,
-            agent_type=request.agentType.value,
-            next_action=planner_result.next_action.value,
-            question_slot=planner_result.question.slot_name if planner_result.question else None,
+            agent_type=agent_type_value,
+            next_action=action_value,
+            question_slot=question_slot,
             slots_filled=len(merged_slots),
             ai_call_made=extraction_result.llm_used,
         )
@@ -480,12 +597,12 @@ async def process_conversation_v2(
         # 4.1 Record metrics for monitoring
         _metrics.record_request(
             llm_used=extraction_result.llm_used,
-            next_action=planner_result.next_action.value,
+            next_action=planner_result.next_action,
         )
 
-        # Log metrics summary every 100 requests
+        # Log metrics summary every 100 requests (after this response is returned)
         if _metrics.total_requests % 100 == 0:
-            _metrics.log_summary()
+            asyncio.get_running_loop().call_soon(_metrics.log_summary)
 
         return response
 
@@ -497,25 +614,38 @@ async def process_conversation_v2(
     except Exception as e:
         logger.error(f"[V2] Unexpected error: {e}", exc_info=True)
         # Record fallback usage in metrics
-        _metrics.record_request(llm_used=False, next_action="ASK_QUESTION", fallback=True)
-        # Return a safe fallback
-        return _create_fallback_response(request)
+        _metrics.record_request(llm_used=False, next_action=PlannerNextAction.ASK_QUESTION, fallback=True)
+        # The caller returns a safe fallback (and does not share it with coalesced duplicates)
+        raise _TurnFailed() from e
+
+
+# Static parts of the ultimate fallback, built once (this path fires on every failed
+# turn during an upstream outage)
+_ULTIMATE_FALLBACK_META = AgentMeta(
+    phoneSource="PLACE",
+    directPhoneSlot=None,
+    title="Assistant",
+    description="",
+)
+_ULTIMATE_FALLBACK_QUESTION = Question(
+    text="What would you like help with?",
+    field="unknown",
+    inputType=InputType.TEXT,
+)
 
 
 def _create_fallback_response(request: ConversationRequest) -> ConversationResponse:
     """Create a safe fallback response when unexpected errors occur."""
     try:
-        spec = get_agent_spec(request.agentType.value)
-        agent_meta = _build_agent_meta(spec)
+        spec, agent_meta = _spec_and_meta(request.agentType.value)
 
         # Find next missing slot
-        existing_slots = request.slots if request.slots else {}
+        existing_slots = request.slots
         missing = get_missing_required_slots(spec, existing_slots)
 
         if missing:
             slot_spec = spec.get_slot_by_name(missing[0])
             if slot_spec:
-                from backend_v2.engine.planner import build_question
                 planner_question = build_question(slot_spec)
                 question = _planner_to_api_question(planner_question)
 
@@ -534,7 +664,6 @@ def _create_fallback_response(request: ConversationRequest) -> ConversationRespo
                 )
 
         # All slots filled but error occurred - show confirmation
-        from backend_v2.engine.planner import build_confirmation_card
         planner_card = build_confirmation_card(spec, existing_slots)
         confirmation_card = _planner_to_api_confirmation_card(planner_card)
 
@@ -554,25 +683,15 @@ def _create_fallback_response(request: ConversationRequest) -> ConversationRespo
 
     except Exception:
         # Ultimate fallback - still provide minimal agentMeta
-        fallback_meta = AgentMeta(
-            phoneSource="PLACE",
-            directPhoneSlot=None,
-            title="Assistant",
-            description="",
-        )
-        return ConversationResponse(
+        return ConversationResponse.model_construct(
             assistantMessage="I'm sorry, something went wrong. Please try again.",
             nextAction=NextAction.ASK_QUESTION,
-            question=Question(
-                text="What would you like help with?",
-                field="unknown",
-                inputType=InputType.TEXT,
-            ),
+            question=_ULTIMATE_FALLBACK_QUESTION,
             extractedData=request.slots if request.slots else {},
             confidence=Confidence.LOW,
             confirmationCard=None,
             placeSearchParams=None,
-            agentMeta=fallback_meta,  # ALWAYS present (even in ultimate fallback)
+            agentMeta=_ULTIMATE_FALLBACK_META,  # ALWAYS present (even in ultimate fallback)
             aiCallMade=False,
             aiModel="fallback",
             engineVersion="v2",
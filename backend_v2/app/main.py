@@ -4,20 +4,30 @@ Calleroo Backend v2 - FastAPI Application
 This backend is the SOLE authority for conversation flow.
 Every request MUST call OpenAI - no caching, no local heuristics.
 
-Python 3.9 compatible.
+Requires Python 3.10+: the agent spec and CallRun dataclasses use
+slots=True. The Docker image runs 3.11.
 """
 
+import asyncio
+import atexit
+import copy
+import hashlib
 import logging
 import os
+import queue
+import re
 from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
+from urllib.parse import quote
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import BackgroundTasks, FastAPI, Form, HTTPException, Query
+from fastapi import BackgroundTasks, FastAPI, Form, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
 from .models import (
     ClientAction,
@@ -29,6 +39,8 @@ from .models import (
     PlaceSearchResponse,
     PlaceDetailsRequest,
     PlaceDetailsResponse,
+    PlaceDetailsBatchRequest,
+    PlaceDetailsBatchResponse,
     GeocodeRequest,
     GeocodeResponse,
     CallBriefRequestV2,
@@ -40,6 +52,8 @@ from .models import (
     CallStatusResponseV1,
     CallResultFormatRequestV1,
     CallResultFormatResponseV1,
+    InputType,
+    Question,
 )
 from .openai_service import OpenAIService
 from .places_service import GooglePlacesService
@@ -80,14 +94,45 @@ for env_path in env_paths:
 else:
     load_dotenv()  # fallback to default behavior
 
+# Public base URL Twilio calls back on; fixed for the life of the process
+WEBHOOK_BASE_URL = os.getenv("WEBHOOK_BASE_URL", "")
+
+
+class _DeferredFormatQueueHandler(QueueHandler):
+    """QueueHandler that leaves traceback formatting to the listener thread.
+
+    The message (msg % args) is still rendered here, on the calling thread, so
+    lazy %s arguments are captured as they are at the logging call rather than
+    whenever the listener gets to them. Only exc_info/stack_info are passed
+    through; the stock prepare() would format those on the event loop too.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 # Configure logging
+# Handlers run on a QueueListener thread so exc_info=True error paths don't
+# format tracebacks or write to stderr on the event loop.
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
 logging.basicConfig(
     level=logging.DEBUG if os.getenv("DEBUG", "false").lower() == "true" else logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[_DeferredFormatQueueHandler(_log_queue)],
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
-# Service instances (Python 3.9 compatible type hints)
+# Maximum chars of a serialized response to log on request.debug
+MAX_DEBUG_LOG_CHARS = 4096
+
+# Service instances
 openai_service: Optional[OpenAIService] = None
 places_service: Optional[GooglePlacesService] = None
 call_brief_service: Optional[CallBriefService] = None
@@ -95,21 +140,30 @@ twilio_service: Optional[TwilioService] = None
 call_result_service: Optional[CallResultService] = None
 
 # Idempotency store for preventing duplicate confirmations
-# Key: idempotencyKey, Value: (response, timestamp)
+# Key: idempotencyKey, Value: (response, monotonic timestamp)
+# Every entry shares the same TTL, so insertion order is also expiry order:
+# expired entries are always at the front and are dropped from there.
 # In production, use Redis or a database
-from typing import Dict, Tuple
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Callable, Dict, Set, Tuple
 
-_idempotency_store: Dict[str, Tuple[ConversationResponse, datetime]] = {}
-_IDEMPOTENCY_TTL = timedelta(minutes=5)
+_idempotency_store: "OrderedDict[str, Tuple[ConversationResponse, float]]" = OrderedDict()
+_IDEMPOTENCY_TTL_S = 300.0
+_IDEMPOTENCY_MAX_ENTRIES = 1000
+_IDEMPOTENCY_SWEEP_BATCH = 4
 
 
 def _get_idempotent_response(key: str) -> Optional[ConversationResponse]:
     """Get cached response for idempotency key if still valid."""
-    if key in _idempotency_store:
-        response, timestamp = _idempotency_store[key]
-        if datetime.now() - timestamp < _IDEMPOTENCY_TTL:
-            logger.info(f"Idempotency hit for key={key}")
+    now = time.monotonic()
+    _sweep_expired_idempotency(now)
+    entry = _idempotency_store.get(key)
+    if entry is not None:
+        response, timestamp = entry
+        if now - timestamp < _IDEMPOTENCY_TTL_S:
+            logger.info("Idempotency hit for key=%s", key)
             return response
         else:
             # Expired, remove it
@@ -117,15 +171,24 @@ def _get_idempotent_response(key: str) -> Optional[ConversationResponse]:
     return None
 
 
+def _sweep_expired_idempotency(now: float) -> None:
+    """Drop up to a small batch of the oldest entries if they have expired."""
+    cutoff = now - _IDEMPOTENCY_TTL_S
+    for k, (_, ts) in list(islice(_idempotency_store.items(), _IDEMPOTENCY_SWEEP_BATCH)):
+        if ts >= cutoff:
+            break
+        del _idempotency_store[k]
+
+
 def _store_idempotent_response(key: str, response: ConversationResponse) -> None:
     """Store response for idempotency."""
-    _idempotency_store[key] = (response, datetime.now())
-    # Clean up old entries (simple LRU-ish cleanup)
-    if len(_idempotency_store) > 1000:
-        cutoff = datetime.now() - _IDEMPOTENCY_TTL
-        keys_to_remove = [k for k, (_, ts) in _idempotency_store.items() if ts < cutoff]
-        for k in keys_to_remove:
-            del _idempotency_store[k]
+    now = time.monotonic()
+    _idempotency_store.pop(key, None)
+    _idempotency_store[key] = (response, now)
+    _sweep_expired_idempotency(now)
+    # Evict oldest entries beyond the cap
+    while len(_idempotency_store) > _IDEMPOTENCY_MAX_ENTRIES:
+        _idempotency_store.popitem(last=False)
 
 
 def _mask_key(key: Optional[str]) -> str:
@@ -204,9 +267,19 @@ async def lifespan(app: FastAPI):
 
     logger.info("=" * 60)
 
+    # Open upstream connections in the background so the first user request
+    # doesn't pay the TCP+TLS handshake; startup doesn't wait on it.
+    warm_ups = [openai_service.warm_up()]
+    if places_service:
+        warm_ups.append(places_service.warm_up())
+    warm_up_task = asyncio.gather(*warm_ups)
+
     yield
 
     # Shutdown
+    warm_up_task.cancel()
+    if openai_service:
+        await openai_service.close()
     if places_service:
         await places_service.close()
     logger.info("Shutting down Calleroo Backend v2")
@@ -217,6 +290,7 @@ app = FastAPI(
     description="Unified conversation API driven entirely by OpenAI",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware for local development
@@ -236,34 +310,34 @@ async def health_check():
 
 
 # Required slots per agent type for fallback question generation
-REQUIRED_SLOTS_MAP = {
+REQUIRED_SLOTS_MAP: Dict[str, Tuple[Tuple[str, str, InputType], ...]] = {
     # (field_name, question_text, input_type)
-    "SICK_CALLER": [
-        ("employer_name", "Who should I call to notify?", "TEXT"),
-        ("employer_phone", "What's their phone number?", "PHONE"),
-        ("caller_name", "What name should I give them?", "TEXT"),
-        ("shift_date", "When is your shift?", "DATE"),
-        ("shift_start_time", "What time does it start?", "TIME"),
-        ("reason_category", "What's the reason?", "CHOICE"),
-    ],
-    "STOCK_CHECKER": [
-        ("retailer_name", "Which retailer should I call?", "TEXT"),
-        ("product_name", "What product are you looking for?", "TEXT"),
-        ("quantity", "How many do you need?", "NUMBER"),
-        ("store_location", "Which suburb or area?", "TEXT"),
-    ],
-    "RESTAURANT_RESERVATION": [
-        ("restaurant_name", "Which restaurant would you like to book?", "TEXT"),
-        ("party_size", "How many people?", "NUMBER"),
-        ("date", "What date?", "DATE"),
-        ("time", "What time?", "TIME"),
-    ],
-    "CANCEL_APPOINTMENT": [
-        ("business_name", "What's the name of the business?", "TEXT"),
-        ("appointment_day", "What day is the appointment?", "DATE"),
-        ("appointment_time", "What time is the appointment?", "TIME"),
-        ("customer_name", "What name is the booking under?", "TEXT"),
-    ],
+    "SICK_CALLER": (
+        ("employer_name", "Who should I call to notify?", InputType.TEXT),
+        ("employer_phone", "What's their phone number?", InputType.PHONE),
+        ("caller_name", "What name should I give them?", InputType.TEXT),
+        ("shift_date", "When is your shift?", InputType.DATE),
+        ("shift_start_time", "What time does it start?", InputType.TIME),
+        ("reason_category", "What's the reason?", InputType.CHOICE),
+    ),
+    "STOCK_CHECKER": (
+        ("retailer_name", "Which retailer should I call?", InputType.TEXT),
+        ("product_name", "What product are you looking for?", InputType.TEXT),
+        ("quantity", "How many do you need?", InputType.NUMBER),
+        ("store_location", "Which suburb or area?", InputType.TEXT),
+    ),
+    "RESTAURANT_RESERVATION": (
+        ("restaurant_name", "Which restaurant would you like to book?", InputType.TEXT),
+        ("party_size", "How many people?", InputType.NUMBER),
+        ("date", "What date?", InputType.DATE),
+        ("time", "What time?", InputType.TIME),
+    ),
+    "CANCEL_APPOINTMENT": (
+        ("business_name", "What's the name of the business?", InputType.TEXT),
+        ("appointment_day", "What day is the appointment?", InputType.DATE),
+        ("appointment_time", "What time is the appointment?", InputType.TIME),
+        ("customer_name", "What name is the booking under?", InputType.TEXT),
+    ),
 }
 
 
@@ -275,26 +349,41 @@ def _get_next_missing_slot(agent_type: str, slots: dict, conversation_id: str =
     CRITICAL: slots should be the MERGED slots (existing + extractedData)
     to avoid asking for a slot that was just extracted.
     """
-    required = REQUIRED_SLOTS_MAP.get(agent_type, [])
-    filled_slots = [f for f, _, _ in required if f in slots and slots.get(f)]
-    missing_slots = [f for f, _, _ in required if f not in slots or not slots.get(f)]
-
-    for field, question_text, input_type in required:
-        if field not in slots or not slots.get(field):
-            # Log for debugging
-            logger.debug(
-                f"nextMissingSlot: agent={agent_type}, "
-                f"filled={filled_slots}, missing={missing_slots}, "
-                f"next={field}, conversationId={conversation_id}"
-            )
-            return (field, question_text, input_type)
+    required = REQUIRED_SLOTS_MAP.get(agent_type, ())
+    next_slot = None
+    for slot in required:
+        if not slots.get(slot[0]):
+            next_slot = slot
+            break
 
-    logger.debug(
-        f"nextMissingSlot: agent={agent_type}, "
-        f"filled={filled_slots}, missing=[], next=None (all complete), "
-        f"conversationId={conversation_id}"
+    if logger.isEnabledFor(logging.DEBUG):
+        filled_slots = [f for f, _, _ in required if slots.get(f)]
+        missing_slots = [f for f, _, _ in required if not slots.get(f)]
+        logger.debug(
+            "nextMissingSlot: agent=%s, filled=%s, missing=%s, next=%s, conversationId=%s",
+            agent_type, filled_slots, missing_slots,
+            next_slot[0] if next_slot else None, conversation_id,
+        )
+    return next_slot
+
+
+def _question_for_next_missing_slot(
+    agent_type: str,
+    merged_slots: dict,
+    conversation_id: str,
+) -> Optional[Question]:
+    """Build the ASK_QUESTION question for the next missing required slot, if any."""
+    next_slot = _get_next_missing_slot(agent_type, merged_slots, conversation_id)
+    if not next_slot:
+        return None
+    field, q_text, input_type = next_slot
+    return Question(
+        text=q_text,
+        field=field,
+        inputType=input_type,
+        choices=None,
+        optional=False,
     )
-    return None
 
 
 def _create_endpoint_fallback_response(
@@ -306,25 +395,10 @@ def _create_endpoint_fallback_response(
 
     This is the FINAL safety net - used only when all else fails.
     """
-    from .models import Question, InputType, Confidence
-
-    next_slot = _get_next_missing_slot(agent_type, slots, conversation_id)
+    question = _question_for_next_missing_slot(agent_type, slots, conversation_id)
 
-    if next_slot:
-        field, question_text, input_type_str = next_slot
-        try:
-            input_type = InputType(input_type_str)
-        except ValueError:
-            input_type = InputType.TEXT
-
-        question = Question(
-            text=question_text,
-            field=field,
-            inputType=input_type,
-            choices=None,
-            optional=False,
-        )
-        assistant_message = question_text
+    if question:
+        assistant_message = question.text
     else:
         question = Question(
             text="Could you please provide more details?",
@@ -336,8 +410,8 @@ def _create_endpoint_fallback_response(
         assistant_message = "I need a bit more information to continue."
 
     logger.warning(
-        f"METRIC endpoint_fallback_used agent={agent_type} "
-        f"conversationId={conversation_id} next_field={question.field}"
+        "METRIC endpoint_fallback_used agent=%s conversationId=%s next_field=%s",
+        agent_type, conversation_id, question.field,
     )
 
     return ConversationResponse(
@@ -353,6 +427,121 @@ def _create_endpoint_fallback_response(
     )
 
 
+def _is_well_formed_response(response: ConversationResponse) -> bool:
+    """Check whether sanitize_conversation_response would have nothing to repair.
+
+    True when the block required by nextAction is present, no conflicting blocks
+    are set, and assistantMessage is non-empty.
+    """
+    next_action = response.nextAction
+    if not response.assistantMessage or not response.assistantMessage.strip():
+        return False
+    if (response.confirmationCard is not None) != (next_action == NextAction.CONFIRM):
+        return False
+    if (response.placeSearchParams is not None) != (next_action == NextAction.FIND_PLACE):
+        return False
+    if next_action == NextAction.ASK_QUESTION:
+        return response.question is not None
+    if next_action in (NextAction.CONFIRM, NextAction.FIND_PLACE):
+        return response.question is None
+    return True
+
+
+# Per-nextAction repairs for sanitize_conversation_response. Each takes the raw
+# response and returns the repaired (next_action, question, assistant_message),
+# appending to warnings/repairs as it goes.
+_RepairResult = Tuple[NextAction, Optional[Question], str]
+
+
+def _repair_find_place(
+    response: ConversationResponse,
+    agent_type: str,
+    merged_slots: dict,
+    conversation_id: str,
+    warnings: list,
+    repairs: list,
+) -> _RepairResult:
+    """FIND_PLACE needs placeSearchParams and must not carry a question."""
+    question = response.question
+    assistant_message = response.assistantMessage
+    if response.placeSearchParams is None:
+        warnings.append("FIND_PLACE_missing_placeSearchParams")
+        repairs.append("downgraded_to_ASK_QUESTION")
+        # Generate a question for next missing slot (using merged_slots!)
+        generated = _question_for_next_missing_slot(agent_type, merged_slots, conversation_id)
+        if generated:
+            question = generated
+            assistant_message = generated.text
+            repairs.append("generated_question_for_missing_slot")
+        else:
+            assistant_message = "I need more information. What's the name of the business you'd like to call?"
+        return NextAction.ASK_QUESTION, question, assistant_message
+    if question is not None:
+        # Conflicting: FIND_PLACE should not have question
+        warnings.append("FIND_PLACE_has_conflicting_question")
+        repairs.append("dropped_question_for_FIND_PLACE")
+    return NextAction.FIND_PLACE, None, assistant_message
+
+
+def _repair_confirm(
+    response: ConversationResponse,
+    agent_type: str,
+    merged_slots: dict,
+    conversation_id: str,
+    warnings: list,
+    repairs: list,
+) -> _RepairResult:
+    """CONFIRM needs a confirmationCard and must not carry a question."""
+    question = response.question
+    assistant_message = response.assistantMessage
+    if response.confirmationCard is None:
+        warnings.append("CONFIRM_missing_confirmationCard")
+        repairs.append("downgraded_to_ASK_QUESTION")
+        # Generate a question for next missing slot (using merged_slots!)
+        generated = _question_for_next_missing_slot(agent_type, merged_slots, conversation_id)
+        if generated:
+            question = generated
+            assistant_message = generated.text
+            repairs.append("generated_question_for_missing_slot")
+        return NextAction.ASK_QUESTION, question, assistant_message
+    if question is not None:
+        # Conflicting: CONFIRM should not have question
+        warnings.append("CONFIRM_has_conflicting_question")
+        repairs.append("dropped_question_for_CONFIRM")
+    return NextAction.CONFIRM, None, assistant_message
+
+
+def _repair_ask_question(
+    response: ConversationResponse,
+    agent_type: str,
+    merged_slots: dict,
+    conversation_id: str,
+    warnings: list,
+    repairs: list,
+) -> _RepairResult:
+    """ASK_QUESTION needs a question; generate one for the next missing slot."""
+    question = response.question
+    assistant_message = response.assistantMessage
+    if question is None:
+        warnings.append("ASK_QUESTION_missing_question")
+        # Generate a question for next missing slot (using merged_slots!)
+        question = _question_for_next_missing_slot(agent_type, merged_slots, conversation_id)
+        if question:
+            repairs.append("generated_question_for_missing_slot")
+            # Use question text as assistant message if message is empty
+            if not assistant_message or not assistant_message.strip():
+                assistant_message = question.text
+                repairs.append("assistantMessage_from_question")
+    return NextAction.ASK_QUESTION, question, assistant_message
+
+
+_ACTION_REPAIRS: Dict[NextAction, Callable[..., _RepairResult]] = {
+    NextAction.FIND_PLACE: _repair_find_place,
+    NextAction.CONFIRM: _repair_confirm,
+    NextAction.ASK_QUESTION: _repair_ask_question,
+}
+
+
 def sanitize_conversation_response(
     response: ConversationResponse,
     conversation_id: str,
@@ -374,25 +563,26 @@ def sanitize_conversation_response(
     - ASK_QUESTION without question -> generate question for next missing slot
     - extractedData null -> normalize to {}
     """
-    from .models import Question, InputType, Confidence
-
     if slots is None:
         slots = {}
 
     # CRITICAL FIX: Merge existing slots with extractedData BEFORE computing nextMissingSlot
     # This prevents asking for a slot that was just extracted
     extracted_data = response.extractedData if response.extractedData else {}
-    merged_slots = {**slots, **extracted_data}
+    merged_slots = {**slots, **extracted_data} if extracted_data else slots
 
     # Log for debugging slot merge issues
-    if extracted_data:
+    if extracted_data and logger.isEnabledFor(logging.DEBUG):
         logger.debug(
-            f"Slot merge: existing={list(slots.keys())}, "
-            f"extracted={list(extracted_data.keys())}, "
-            f"merged={list(merged_slots.keys())} "
-            f"conversationId={conversation_id}"
+            "Slot merge: existing=%s, extracted=%s, merged=%s conversationId=%s",
+            list(slots.keys()), list(extracted_data.keys()),
+            list(merged_slots.keys()), conversation_id,
         )
 
+    # Fast path: response is already well-formed, only extractedData needs the merged slots
+    if _is_well_formed_response(response):
+        return response.model_copy(update={"extractedData": merged_slots})
+
     warnings = []
     repairs = []
 
@@ -404,87 +594,11 @@ def sanitize_conversation_response(
     assistant_message = response.assistantMessage
 
     # Handle conflicting blocks: nextAction takes precedence
-    if next_action == NextAction.FIND_PLACE:
-        if place_search_params is None:
-            warnings.append("FIND_PLACE_missing_placeSearchParams")
-            next_action = NextAction.ASK_QUESTION
-            repairs.append("downgraded_to_ASK_QUESTION")
-            # Generate a question for next missing slot (using merged_slots!)
-            next_slot = _get_next_missing_slot(agent_type, merged_slots, conversation_id)
-            if next_slot:
-                field, q_text, input_type_str = next_slot
-                try:
-                    input_type = InputType(input_type_str)
-                except ValueError:
-                    input_type = InputType.TEXT
-                question = Question(
-                    text=q_text,
-                    field=field,
-                    inputType=input_type,
-                    choices=None,
-                    optional=False,
-                )
-                assistant_message = q_text
-                repairs.append("generated_question_for_missing_slot")
-            else:
-                assistant_message = "I need more information. What's the name of the business you'd like to call?"
-        elif question is not None:
-            # Conflicting: FIND_PLACE should not have question
-            warnings.append("FIND_PLACE_has_conflicting_question")
-            question = None
-            repairs.append("dropped_question_for_FIND_PLACE")
-
-    elif next_action == NextAction.CONFIRM:
-        if confirmation_card is None:
-            warnings.append("CONFIRM_missing_confirmationCard")
-            next_action = NextAction.ASK_QUESTION
-            repairs.append("downgraded_to_ASK_QUESTION")
-            # Generate a question for next missing slot (using merged_slots!)
-            next_slot = _get_next_missing_slot(agent_type, merged_slots, conversation_id)
-            if next_slot:
-                field, q_text, input_type_str = next_slot
-                try:
-                    input_type = InputType(input_type_str)
-                except ValueError:
-                    input_type = InputType.TEXT
-                question = Question(
-                    text=q_text,
-                    field=field,
-                    inputType=input_type,
-                    choices=None,
-                    optional=False,
-                )
-                assistant_message = q_text
-                repairs.append("generated_question_for_missing_slot")
-        elif question is not None:
-            # Conflicting: CONFIRM should not have question
-            warnings.append("CONFIRM_has_conflicting_question")
-            question = None
-            repairs.append("dropped_question_for_CONFIRM")
-
-    elif next_action == NextAction.ASK_QUESTION:
-        if question is None:
-            warnings.append("ASK_QUESTION_missing_question")
-            # Generate a question for next missing slot (using merged_slots!)
-            next_slot = _get_next_missing_slot(agent_type, merged_slots, conversation_id)
-            if next_slot:
-                field, q_text, input_type_str = next_slot
-                try:
-                    input_type = InputType(input_type_str)
-                except ValueError:
-                    input_type = InputType.TEXT
-                question = Question(
-                    text=q_text,
-                    field=field,
-                    inputType=input_type,
-                    choices=None,
-                    optional=False,
-                )
-                repairs.append("generated_question_for_missing_slot")
-                # Use question text as assistant message if message is empty
-                if not assistant_message or not assistant_message.strip():
-                    assistant_message = q_text
-                    repairs.append("assistantMessage_from_question")
+    repair = _ACTION_REPAIRS.get(next_action)
+    if repair is not None:
+        next_action, question, assistant_message = repair(
+            response, agent_type, merged_slots, conversation_id, warnings, repairs
+        )
 
     # Check and repair assistantMessage (after question generation)
     if not assistant_message or not assistant_message.strip():
@@ -501,16 +615,15 @@ def sanitize_conversation_response(
     # Format: METRIC sanitization_applied agent=X repairs=N warnings=N
     if repairs:
         logger.info(
-            f"METRIC sanitization_applied agent={agent_type} "
-            f"repairs={len(repairs)} warnings={len(warnings)} "
-            f"conversationId={conversation_id}"
+            "METRIC sanitization_applied agent=%s repairs=%d warnings=%d conversationId=%s",
+            agent_type, len(repairs), len(warnings), conversation_id,
         )
 
     # Log details if any issues found
     if warnings:
         logger.warning(
-            f"Response sanitized [conversationId={conversation_id}, agent={agent_type}]: "
-            f"warnings={warnings}, repairs={repairs}"
+            "Response sanitized [conversationId=%s, agent=%s]: warnings=%s, repairs=%s",
+            conversation_id, agent_type, warnings, repairs,
         )
 
     # CRITICAL FIX: Always return merged_slots (existing + extracted) to maintain full slot state
@@ -534,6 +647,39 @@ def sanitize_conversation_response(
     )
 
 
+# Deterministic CONFIRM/REJECT responses are static apart from extractedData,
+# so each turn copies one of these templates instead of re-validating a new model.
+_CONFIRM_RESPONSE_TEMPLATE = ConversationResponse(
+    assistantMessage="Okay — placing the call now.",
+    nextAction=NextAction.COMPLETE,
+    question=None,
+    extractedData={},
+    confidence=Confidence.HIGH,
+    confirmationCard=None,
+    placeSearchParams=None,
+    aiCallMade=False,
+    aiModel="deterministic",
+)
+
+_REJECT_RESPONSE_TEMPLATE = ConversationResponse(
+    assistantMessage="No problem! What would you like to change?",
+    nextAction=NextAction.ASK_QUESTION,
+    question=Question(
+        text="What would you like to change?",
+        field="correction",
+        inputType=InputType.TEXT,
+        choices=None,
+        optional=False,
+    ),
+    extractedData={},
+    confidence=Confidence.HIGH,
+    confirmationCard=None,
+    placeSearchParams=None,
+    aiCallMade=False,
+    aiModel="deterministic",
+)
+
+
 @app.post("/conversation/next", response_model=ConversationResponse)
 async def conversation_next(request: ConversationRequest) -> ConversationResponse:
     """
@@ -562,170 +708,147 @@ async def conversation_next(request: ConversationRequest) -> ConversationRespons
 
     The Android client MUST NOT decide questions, slots, flow order, or "what to ask next".
     """
-    msg_preview = request.userMessage[:50] + "..." if len(request.userMessage) > 50 else request.userMessage
-    logger.info(
-        f"Conversation turn: id={request.conversationId}, "
-        f"agent={request.agentType}, "
-        f"clientAction={request.clientAction}, "
-        f"message='{msg_preview}'"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        msg_preview = request.userMessage[:50] + "..." if len(request.userMessage) > 50 else request.userMessage
+        logger.info(
+            "Conversation turn: id=%s, agent=%s, clientAction=%s, message='%s'",
+            request.conversationId,
+            request.agentType.value,
+            request.clientAction and request.clientAction.value,
+            msg_preview,
+        )
 
     # TOP-LEVEL EXCEPTION BARRIER: wrap everything to guarantee no 500s from model output
     try:
-        # ============================================================
-        # IDEMPOTENCY CHECK: prevent duplicate actions (e.g., double-tap confirm)
-        # ============================================================
-        if request.idempotencyKey:
-            cached_response = _get_idempotent_response(request.idempotencyKey)
-            if cached_response:
-                logger.info(
-                    f"METRIC idempotency_hit conversationId={request.conversationId} "
-                    f"key={request.idempotencyKey}"
-                )
-                return cached_response
-
-        # ============================================================
-        # DETERMINISTIC CLIENT ACTIONS: bypass OpenAI for CONFIRM/REJECT
-        # ============================================================
-        if request.clientAction == ClientAction.CONFIRM:
-            # User tapped "Yes, call them" - proceed to COMPLETE (or FIND_PLACE if no phone yet)
-            logger.info(
-                f"METRIC client_action_confirm conversationId={request.conversationId} "
-                f"agent={request.agentType.value} "
-                f"slots_keys={list(request.slots.keys()) if request.slots else []}"
-            )
+        return await _conversation_next_turn(request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        # FINAL SAFETY NET: if anything unexpected happens, return a safe fallback
+        logger.error(
+            "METRIC endpoint_unexpected_error conversationId=%s agent=%s error=%s",
+            request.conversationId, request.agentType.value, type(e).__name__,
+            exc_info=True
+        )
+        # Return a safe fallback instead of 500
+        return _create_endpoint_fallback_response(
+            request.agentType.value,
+            request.slots,
+            request.conversationId,
+        )
 
-            # CRITICAL: Preserve all slots in extractedData
-            # Without this, Android loses all slot state after CONFIRM
-            preserved_slots = request.slots if request.slots else {}
-
-            response = ConversationResponse(
-                assistantMessage="Okay — placing the call now.",
-                nextAction=NextAction.COMPLETE,
-                question=None,
-                extractedData=preserved_slots,  # CRITICAL: Preserve all slots
-                confidence=Confidence.HIGH,
-                confirmationCard=None,
-                placeSearchParams=None,
-                aiCallMade=False,
-                aiModel="deterministic",
-            )
 
+async def _conversation_next_turn(request: ConversationRequest) -> ConversationResponse:
+    """Run one v1 turn; conversation_next wraps this in the exception barrier."""
+    # ============================================================
+    # IDEMPOTENCY CHECK: prevent duplicate actions (e.g., double-tap confirm)
+    # ============================================================
+    if request.idempotencyKey:
+        cached_response = _get_idempotent_response(request.idempotencyKey)
+        if cached_response:
             logger.info(
-                f"CONFIRM response: extractedData keys={list(preserved_slots.keys())}"
+                "METRIC idempotency_hit conversationId=%s key=%s",
+                request.conversationId, request.idempotencyKey,
             )
+            return cached_response
 
-            # Store for idempotency
-            if request.idempotencyKey:
-                _store_idempotent_response(request.idempotencyKey, response)
-
-            return response
-
-        elif request.clientAction == ClientAction.REJECT:
-            # User tapped "Not quite" - ask what needs to be corrected
-            logger.info(
-                f"METRIC client_action_reject conversationId={request.conversationId} "
-                f"agent={request.agentType.value} "
-                f"slots_keys={list(request.slots.keys()) if request.slots else []}"
-            )
+    # ============================================================
+    # DETERMINISTIC CLIENT ACTIONS: bypass OpenAI for CONFIRM/REJECT
+    # ============================================================
+    if request.clientAction == ClientAction.CONFIRM:
+        # User tapped "Yes, call them" - proceed to COMPLETE (or FIND_PLACE if no phone yet)
+        logger.info(
+            "METRIC client_action_confirm conversationId=%s agent=%s slots_keys=%s",
+            request.conversationId, request.agentType.value,
+            list(request.slots.keys()) if request.slots else [],
+        )
 
-            from .models import Question, InputType
-
-            # CRITICAL: Preserve all slots in extractedData
-            # Without this, Android loses all slot state after REJECT
-            preserved_slots = request.slots if request.slots else {}
-
-            response = ConversationResponse(
-                assistantMessage="No problem! What would you like to change?",
-                nextAction=NextAction.ASK_QUESTION,
-                question=Question(
-                    text="What would you like to change?",
-                    field="correction",
-                    inputType=InputType.TEXT,
-                    choices=None,
-                    optional=False,
-                ),
-                extractedData=preserved_slots,  # CRITICAL: Preserve all slots
-                confidence=Confidence.HIGH,
-                confirmationCard=None,
-                placeSearchParams=None,
-                aiCallMade=False,
-                aiModel="deterministic",
-            )
+        # CRITICAL: Preserve all slots in extractedData
+        # Without this, Android loses all slot state after CONFIRM
+        preserved_slots = request.slots if request.slots else {}
 
-            logger.info(
-                f"REJECT response: extractedData keys={list(preserved_slots.keys())}"
-            )
+        response = _CONFIRM_RESPONSE_TEMPLATE.model_copy(
+            update={"extractedData": preserved_slots}  # CRITICAL: Preserve all slots
+        )
 
-            # Store for idempotency
-            if request.idempotencyKey:
-                _store_idempotent_response(request.idempotencyKey, response)
+        logger.info("CONFIRM response: extractedData keys=%s", list(preserved_slots.keys()))
 
-            return response
+        # Store for idempotency
+        if request.idempotencyKey:
+            _store_idempotent_response(request.idempotencyKey, response)
 
-        # ============================================================
-        # NORMAL FLOW: Call OpenAI
-        # ============================================================
-        if openai_service is None:
-            raise HTTPException(status_code=503, detail="Service not initialized")
+        return response
 
-        # Call OpenAI - the service guarantees no exceptions from model output
-        response = await openai_service.get_next_turn(
-            agent_type=request.agentType,
-            user_message=request.userMessage,
-            slots=request.slots,
-            message_history=request.messageHistory,
-            conversation_id=request.conversationId,
+    elif request.clientAction == ClientAction.REJECT:
+        # User tapped "Not quite" - ask what needs to be corrected
+        logger.info(
+            "METRIC client_action_reject conversationId=%s agent=%s slots_keys=%s",
+            request.conversationId, request.agentType.value,
+            list(request.slots.keys()) if request.slots else [],
         )
 
-        # Sanitize response: validate and auto-repair invalid combinations
-        # This now returns merged_slots (existing + extracted) as extractedData
-        response = sanitize_conversation_response(
-            response,
-            request.conversationId,
-            request.agentType.value,
-            request.slots,
-        )
+        # CRITICAL: Preserve all slots in extractedData
+        # Without this, Android loses all slot state after REJECT
+        preserved_slots = request.slots if request.slots else {}
 
-        # Log slot sync warning if client slots are behind merged state
-        if response.extractedData and request.slots:
-            merged_keys = set(response.extractedData.keys())
-            client_keys = set(request.slots.keys())
-            new_keys = merged_keys - client_keys
-            if new_keys:
-                logger.info(
-                    f"Slot sync: client missing keys={list(new_keys)}, "
-                    f"returning full merged state with {len(merged_keys)} keys "
-                    f"conversationId={request.conversationId}"
-                )
-
-        # Log the response
-        logger.info(
-            f"Response: action={response.nextAction}, "
-            f"aiCallMade={response.aiCallMade}, "
-            f"model={response.aiModel}"
+        response = _REJECT_RESPONSE_TEMPLATE.model_copy(
+            update={"extractedData": preserved_slots}  # CRITICAL: Preserve all slots
         )
 
-        if request.debug:
-            logger.debug(f"Full response: {response.model_dump_json()}")
+        logger.info("REJECT response: extractedData keys=%s", list(preserved_slots.keys()))
+
+        # Store for idempotency
+        if request.idempotencyKey:
+            _store_idempotent_response(request.idempotencyKey, response)
 
         return response
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        # FINAL SAFETY NET: if anything unexpected happens, return a safe fallback
-        logger.error(
-            f"METRIC endpoint_unexpected_error conversationId={request.conversationId} "
-            f"agent={request.agentType.value} error={type(e).__name__}",
-            exc_info=True
-        )
-        # Return a safe fallback instead of 500
-        return _create_endpoint_fallback_response(
-            request.agentType.value,
-            request.slots,
-            request.conversationId,
-        )
+    # ============================================================
+    # NORMAL FLOW: Call OpenAI
+    # ============================================================
+    if openai_service is None:
+        raise HTTPException(status_code=503, detail="Service not initialized")
+
+    # Call OpenAI - the service guarantees no exceptions from model output
+    response = await openai_service.get_next_turn(
+        agent_type=request.agentType,
+        user_message=request.userMessage,
+        slots=request.slots,
+        message_history=request.messageHistory,
+        conversation_id=request.conversationId,
+    )
+
+    # Sanitize response: validate and auto-repair invalid combinations
+    # This now returns merged_slots (existing + extracted) as extractedData
+    response = sanitize_conversation_response(
+        response,
+        request.conversationId,
+        request.agentType.value,
+        request.slots,
+    )
+
+    # Log slot sync warning if client slots are behind merged state
+    if response.extractedData and request.slots and logger.isEnabledFor(logging.INFO):
+        merged_keys = set(response.extractedData.keys())
+        client_keys = set(request.slots.keys())
+        new_keys = merged_keys - client_keys
+        if new_keys:
+            logger.info(
+                "Slot sync: client missing keys=%s, returning full merged state "
+                "with %d keys conversationId=%s",
+                list(new_keys), len(merged_keys), request.conversationId,
+            )
+
+    # Log the response
+    logger.info(
+        "Response: action=%s, aiCallMade=%s, model=%s",
+        response.nextAction.value, response.aiCallMade, response.aiModel,
+    )
+
+    if request.debug and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Full response: %s", response.model_dump_json()[:MAX_DEBUG_LOG_CHARS])
+
+    return response
 
 
 # ============================================================
@@ -761,7 +884,7 @@ async def conversation_next_v2(request: ConversationRequest) -> ConversationResp
     # Kill switch check - instant rollback to v1
     kill_switch = os.getenv("CONVERSATION_ENGINE_KILL_SWITCH", "false").lower() == "true"
     if kill_switch:
-        logger.info(f"[KILL_SWITCH] Routing /v2 request to v1 for conversationId={request.conversationId}")
+        logger.info("[KILL_SWITCH] Routing /v2 request to v1 for conversationId=%s", request.conversationId)
         return await conversation_next(request)
 
     # Use the OpenAI client for extraction if needed
@@ -780,7 +903,7 @@ async def conversation_next_v2(request: ConversationRequest) -> ConversationResp
 # ============================================================
 
 # Allowed radius values for place search
-ALLOWED_RADII = [25, 50, 100]
+ALLOWED_RADII = frozenset({25, 50, 100})
 
 
 @app.post("/places/geocode", response_model=GeocodeResponse)
@@ -794,7 +917,7 @@ async def places_geocode(request: GeocodeRequest) -> GeocodeResponse:
     Returns:
         GeocodeResponse with lat/lng or error
     """
-    logger.info(f"Places geocode: area='{request.area}', country='{request.country}'")
+    logger.info("Places geocode: area='%s', country='%s'", request.area, request.country)
 
     if places_service is None:
         raise HTTPException(
@@ -809,8 +932,8 @@ async def places_geocode(request: GeocodeRequest) -> GeocodeResponse:
         )
 
         logger.info(
-            f"Geocode result: lat={response.latitude}, lng={response.longitude}, "
-            f"error={response.error}"
+            "Geocode result: lat=%s, lng=%s, error=%s",
+            response.latitude, response.longitude, response.error,
         )
 
         return response
@@ -840,9 +963,8 @@ async def places_search(request: PlaceSearchRequest) -> PlaceSearchResponse:
     Radius must be 25, 50, or 100 km - returns 400 for invalid values.
     """
     logger.info(
-        f"Places search: query='{request.query}', "
-        f"area='{request.area}', "
-        f"radius={request.radius_km}km"
+        "Places search: query='%s', area='%s', radius=%skm",
+        request.query, request.area, request.radius_km,
     )
 
     # Validate radius - return 400 for invalid values
@@ -850,7 +972,7 @@ async def places_search(request: PlaceSearchRequest) -> PlaceSearchResponse:
         logger.warning(f"Invalid radius {request.radius_km}km, rejecting with 400")
         raise HTTPException(
             status_code=400,
-            detail=f"invalid_radius: radius_km must be one of {ALLOWED_RADII}, got {request.radius_km}"
+            detail=f"invalid_radius: radius_km must be one of {sorted(ALLOWED_RADII)}, got {request.radius_km}"
         )
 
     if places_service is None:
@@ -868,9 +990,8 @@ async def places_search(request: PlaceSearchRequest) -> PlaceSearchResponse:
         )
 
         logger.info(
-            f"Places search result: {len(response.candidates)} candidates, "
-            f"radius={response.radiusKm}km, pass={response.passNumber}, "
-            f"error={response.error}"
+            "Places search result: %d candidates, radius=%skm, pass=%s, error=%s",
+            len(response.candidates), response.radiusKm, response.passNumber, response.error,
         )
 
         return response
@@ -894,7 +1015,7 @@ async def places_details(request: PlaceDetailsRequest) -> PlaceDetailsResponse:
     Returns phoneE164 if the place has a valid phone number.
     Returns error="NO_PHONE" if the place has no valid phone.
     """
-    logger.info(f"Places details: placeId='{request.placeId}'")
+    logger.info("Places details: placeId='%s'", request.placeId)
 
     if places_service is None:
         raise HTTPException(
@@ -906,9 +1027,8 @@ async def places_details(request: PlaceDetailsRequest) -> PlaceDetailsResponse:
         response = await places_service.place_details(request.placeId)
 
         logger.info(
-            f"Places details result: name='{response.name}', "
-            f"phoneE164={response.phoneE164 or 'None'}, "
-            f"error={response.error}"
+            "Places details result: name='%s', phoneE164=%s, error=%s",
+            response.name, response.phoneE164 or "None", response.error,
         )
 
         return response
@@ -921,6 +1041,36 @@ async def places_details(request: PlaceDetailsRequest) -> PlaceDetailsResponse:
         )
 
 
+@app.post("/places/details/batch", response_model=PlaceDetailsBatchResponse)
+async def places_details_batch(request: PlaceDetailsBatchRequest) -> PlaceDetailsBatchResponse:
+    """
+    Get details for up to 20 places in one request.
+
+    This endpoint does NOT call OpenAI - it is deterministic.
+    Fans out Google Places Details calls concurrently (bounded).
+
+    Each result has the same shape as /places/details; a failure for one
+    place is reported in that place's error field.
+    """
+    logger.info("Places details batch: %d placeIds", len(request.placeIds))
+
+    if places_service is None:
+        raise HTTPException(
+            status_code=500,
+            detail="places_key_missing: GOOGLE_PLACES_API_KEY not configured"
+        )
+
+    results = await places_service.place_details_batch(request.placeIds)
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Places details batch result: %d places, with_phone=%d",
+            len(results), sum(1 for r in results if r.phoneE164),
+        )
+
+    return PlaceDetailsBatchResponse(results=results)
+
+
 # ============================================================
 # Call Brief Endpoints (Screen 4 - OpenAI generates call script)
 # ============================================================
@@ -944,9 +1094,8 @@ async def call_brief(request: CallBriefRequestV2) -> CallBriefResponseV2:
     Returns 400 for invalid phone number.
     """
     logger.info(
-        f"Call brief: conversationId={request.conversationId}, "
-        f"agentType={request.agentType}, "
-        f"place={request.place.businessName}"
+        "Call brief: conversationId=%s, agentType=%s, place=%s",
+        request.conversationId, request.agentType, request.place.businessName,
     )
 
     # Validate phone E.164 format
@@ -987,13 +1136,12 @@ async def call_brief(request: CallBriefRequestV2) -> CallBriefResponseV2:
         )
 
         logger.info(
-            f"Call brief generated: objective='{objective[:50]}...', "
-            f"missingFields={missing_fields}, "
-            f"checklistItems={len(checklist)}"
+            "Call brief generated: objective='%s...', missingFields=%s, checklistItems=%d",
+            objective[:50], missing_fields, len(checklist),
         )
 
-        if request.debug:
-            logger.debug(f"Full call brief response: {response.model_dump_json()}")
+        if request.debug and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Full call brief response: %s", response.model_dump_json()[:MAX_DEBUG_LOG_CHARS])
 
         return response
 
@@ -1064,10 +1212,8 @@ async def call_start(request: CallStartRequestV3) -> CallStartResponseV3:
         503: Twilio not configured
     """
     logger.info(
-        f"Call start V3: conversationId={request.conversationId}, "
-        f"agentType={request.agentType}, "
-        f"placeId={request.placeId}, "
-        f"phone={request.phoneE164}"
+        "Call start V3: conversationId=%s, agentType=%s, placeId=%s, phone=%s",
+        request.conversationId, request.agentType, request.placeId, request.phoneE164,
     )
 
     # Validate phone E.164 format
@@ -1086,7 +1232,7 @@ async def call_start(request: CallStartRequestV3) -> CallStartResponseV3:
         )
 
     try:
-        call_run = twilio_service.start_call(
+        call_run = await twilio_service.start_call(
             conversation_id=request.conversationId,
             agent_type=request.agentType,
             phone_e164=request.phoneE164,
@@ -1114,8 +1260,43 @@ async def call_start(request: CallStartRequestV3) -> CallStartResponseV3:
         )
 
 
+# Call statuses after which Twilio sends no further status callbacks
+TERMINAL_CALL_STATUSES = frozenset({"completed", "failed", "busy", "no-answer", "canceled"})
+CALL_STATUS_STREAM_INTERVAL_S = 1.0
+CALL_STATUS_STREAM_MAX_S = 15 * 60.0
+
+
+def _call_status_body(call_run) -> bytes:
+    """Serialize a call run as a CallStatusResponseV1 JSON body."""
+    return orjson.dumps(CallStatusResponseV1(
+        callId=call_run.call_id,
+        status=call_run.status,
+        durationSeconds=call_run.duration_seconds,
+        transcript=call_run.transcript,
+        outcome=call_run.outcome,
+        error=call_run.error,
+        cost=call_run.cost,
+        costCurrency=call_run.cost_currency,
+    ).model_dump(mode="json"))
+
+
+def _call_run_or_404(call_id: str):
+    """Get a call run from in-memory storage (works even if Twilio not configured)."""
+    call_run = CALL_RUNS.get(call_id)
+    if not call_run:
+        logger.warning(f"Call not found: {call_id}")
+        raise HTTPException(
+            status_code=404,
+            detail=f"call_not_found: No call with ID {call_id}"
+        )
+    return call_run
+
+
 @app.get("/call/status/{call_id}", response_model=CallStatusResponseV1)
-async def call_status(call_id: str) -> CallStatusResponseV1:
+async def call_status(
+    call_id: str,
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
     """
     Get the status of a call.
 
@@ -1124,32 +1305,69 @@ async def call_status(call_id: str) -> CallStatusResponseV1:
     - outcome (from OpenAI analysis)
     - duration
 
+    The response carries an ETag of its body. Clients poll this endpoint
+    every 1-2 seconds, so a matching If-None-Match gets an empty 304.
+
     Returns:
         CallStatusResponseV1 with current status and results
 
     Errors:
         404: Call not found
     """
-    logger.debug(f"Call status request: callId={call_id}")
+    logger.debug("Call status request: callId=%s", call_id)
 
-    # Get call run from in-memory storage (works even if Twilio not configured)
-    call_run = CALL_RUNS.get(call_id)
-    if not call_run:
-        logger.warning(f"Call not found: {call_id}")
-        raise HTTPException(
-            status_code=404,
-            detail=f"call_not_found: No call with ID {call_id}"
-        )
+    body = _call_status_body(_call_run_or_404(call_id))
 
-    return CallStatusResponseV1(
-        callId=call_run.call_id,
-        status=call_run.status,
-        durationSeconds=call_run.duration_seconds,
-        transcript=call_run.transcript,
-        outcome=call_run.outcome,
-        error=call_run.error,
-        cost=call_run.cost,
-        costCurrency=call_run.cost_currency,
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@app.get("/call/status/{call_id}/stream")
+async def call_status_stream(call_id: str) -> StreamingResponse:
+    """
+    Stream the status of a call as Server-Sent Events.
+
+    Each event's data is a CallStatusResponseV1 body, sent once on connect
+    and again whenever it changes, so clients can hold one connection
+    instead of polling /call/status. The stream ends once the call has ended
+    and (for completed calls) post-call processing has set an outcome or
+    error, or after CALL_STATUS_STREAM_MAX_S.
+
+    Errors:
+        404: Call not found
+    """
+    logger.debug("Call status stream request: callId=%s", call_id)
+
+    _call_run_or_404(call_id)
+
+    async def events():
+        last_body = None
+        deadline = time.monotonic() + CALL_STATUS_STREAM_MAX_S
+        while True:
+            call_run = CALL_RUNS.get(call_id)
+            if call_run is None:
+                return
+            body = _call_status_body(call_run)
+            if body != last_body:
+                yield b"data: " + body + b"\n\n"
+                last_body = body
+            if call_run.status in TERMINAL_CALL_STATUSES and (
+                call_run.status != "completed"
+                or call_run.outcome is not None
+                or call_run.error is not None
+            ):
+                return
+            if time.monotonic() >= deadline:
+                return
+            await asyncio.sleep(CALL_STATUS_STREAM_INTERVAL_S)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
     )
 
 
@@ -1170,7 +1388,7 @@ async def format_call_result(request: CallResultFormatRequestV1) -> CallResultFo
     Errors:
         500: OpenAI formatting failed
     """
-    logger.info(f"Call result format request: callId={request.callId}, status={request.status}")
+    logger.info("Call result format request: callId=%s, status=%s", request.callId, request.status)
 
     if call_result_service is None:
         raise HTTPException(
@@ -1226,6 +1444,74 @@ def _escape_xml(text: str) -> str:
     )
 
 
+# Filler and acknowledgement constants, escaped once for TwiML
+_ESCAPED_FILLERS = tuple(_escape_xml(phrase) for phrase in FILLER_PHRASES)
+_ESCAPED_POLL_FILLERS = tuple(_escape_xml(phrase) for phrase in POLL_FILLER_PHRASES)
+_ESCAPED_HOLD_ACK = _escape_xml(HOLD_ACKNOWLEDGEMENT)
+
+# Fixed hangup TwiML for the webhooks' fail-fast paths, encoded once
+
+# No call run for the conversation
+_TWIML_NO_CALL_RUN = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Say voice="en-AU-Wavenet-C" language="en-AU">I'm sorry, something went wrong. Goodbye.</Say>
+    <Hangup/>
+</Response>"""
+
+# Call already terminal (race condition / Twilio retry)
+_TWIML_HANGUP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Hangup/>
+</Response>"""
+
+# Too many silences
+_TWIML_SILENCE_HANGUP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Say voice="en-AU-Wavenet-C" language="en-AU">I haven't heard anything. Thanks for your time. Goodbye.</Say>
+    <Hangup/>
+</Response>"""
+
+# Turn limit reached
+_TWIML_TURN_LIMIT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Say voice="en-AU-Wavenet-C" language="en-AU">Thank you so much for your help. I have all the information I need. Have a great day. Goodbye.</Say>
+    <Hangup/>
+</Response>"""
+
+# twilio_service not initialized
+_TWIML_SERVICE_UNAVAILABLE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Say voice="en-AU-Wavenet-C" language="en-AU">I'm sorry, I'm having technical difficulties. Goodbye.</Say>
+    <Hangup/>
+</Response>"""
+
+# Reply not ready within the poll hard cap
+_TWIML_POLL_TIMEOUT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Say voice="en-AU-Wavenet-C" language="en-AU">I apologize, I'm having technical difficulties. Thank you for your patience. Goodbye.</Say>
+    <Hangup/>
+</Response>"""
+
+
+# Punctuation stripped before goodbye-phrase matching ("goodbye!" "goodbye." "goodbye," etc.)
+_TERMINAL_PUNCT_RE = re.compile(r'[.,!;:\-—]+')
+
+# Goodbye phrases, checked as substrings of the normalized text.
+# "bye" also covers "goodbye", "good bye" and "bye bye", so those aren't listed.
+_GOODBYE_PHRASES = (
+    "thank you for your time",
+    "thanks for your time",
+    "have a great day",
+    "have a good day",
+    "have a nice day",
+    "take care",
+    "bye",
+)
+# Every goodbye phrase contains one of these words, so text without any of
+# them can't be terminal and skips normalization.
+_GOODBYE_KEYWORDS = ("bye", "day", "care", "time")
+
+
 def _is_terminal_text(text: str) -> bool:
     """Check if text indicates the agent is ending the call (goodbye intent).
 
@@ -1243,29 +1529,14 @@ def _is_terminal_text(text: str) -> bool:
     if "?" in text:
         return False
 
+    if not any(keyword in text_lower for keyword in _GOODBYE_KEYWORDS):
+        return False
+
     # Normalize text: remove extra punctuation for matching
-    # This handles "goodbye!" "goodbye." "goodbye," etc.
-    import re
-    text_normalized = re.sub(r'[.,!;:\-—]+', ' ', text_lower)
+    text_normalized = _TERMINAL_PUNCT_RE.sub(' ', text_lower)
     text_normalized = ' '.join(text_normalized.split())  # Collapse whitespace
 
-    # Check for goodbye phrases (order matters - check specific phrases first)
-    goodbye_phrases = [
-        # Longer/specific phrases first
-        "thank you for your time",
-        "thanks for your time",
-        "have a great day",
-        "have a good day",
-        "have a nice day",
-        "take care",
-        # Short phrases last (to avoid false positives)
-        "goodbye",
-        "good bye",
-        "bye bye",
-        "bye",
-    ]
-
-    for phrase in goodbye_phrases:
+    for phrase in _GOODBYE_PHRASES:
         if phrase in text_normalized:
             return True
 
@@ -1274,9 +1545,34 @@ def _is_terminal_text(text: str) -> bool:
 
 
 
+# Agent reply generations in flight. Held here until done so the event loop
+# doesn't garbage-collect a running task.
+_agent_generation_tasks: "Set[asyncio.Task[None]]" = set()
+
+
+def _start_agent_generation(call_id: str, user_speech: str) -> None:
+    """Start generating the agent's next reply right away.
+
+    Unlike a BackgroundTasks job, which runs only after the TwiML response
+    has been sent, the OpenAI request is under way while the response is
+    still being built and returned to Twilio.
+    """
+    task = asyncio.create_task(twilio_service.generate_agent_response_async(call_id, user_speech))
+    _agent_generation_tasks.add(task)
+    task.add_done_callback(_agent_generation_tasks.discard)
+
+
+def _twilio_webhook_url(path: str, conversation_id: str) -> str:
+    """Build a Twilio callback URL for a conversation.
+
+    The conversationId is percent-encoded once here; callers append further
+    query params with "&amp;" since the URL is embedded in TwiML.
+    """
+    return f"{WEBHOOK_BASE_URL}/twilio/{path}?conversationId={quote(conversation_id, safe='')}"
+
+
 @app.post("/twilio/voice")
 async def twilio_voice(
-    background_tasks: BackgroundTasks,
     conversationId: str = Query(...)
 ):
     """
@@ -1285,15 +1581,13 @@ async def twilio_voice(
     User speaks FIRST. Opener is pre-warmed in background but NOT spoken
     until after the user's first speech ends and Twilio posts to /twilio/gather.
     """
-    voice_received_at = datetime.utcnow()
-    logger.info(f"[TIMING] /twilio/voice received at {voice_received_at.isoformat()} for conversationId={conversationId}")
-
-    # Find the call run by conversation_id
-    call_run = None
-    for run in CALL_RUNS.values():
-        if run.conversation_id == conversationId:
-            call_run = run
-            break
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "[TIMING] /twilio/voice received at %s for conversationId=%s",
+            datetime.utcnow().isoformat(), conversationId,
+        )
+
+    call_run = CALL_RUNS.get_by_conversation(conversationId)
 
     if call_run:
         # Initialize live conversation state
@@ -1304,18 +1598,14 @@ async def twilio_voice(
         # Start generating opener if not already ready
         if twilio_service is not None and call_run.pending_agent_reply is None:
             opener_context = f"The callee just answered the phone. Greet them briefly and state why you're calling based on: {call_run.script_preview}"
-            background_tasks.add_task(
-                twilio_service.generate_agent_response_async,
-                call_run.call_id,
-                opener_context
-            )
-            logger.info(f"[TIMING] Pre-warming opener started for call {call_run.call_id}")
+            _start_agent_generation(call_run.call_id, opener_context)
+            logger.info("[TIMING] Pre-warming opener started for call %s", call_run.call_id)
         elif call_run.pending_agent_reply is not None:
-            logger.info(f"[TIMING] Opener already ready for call {call_run.call_id}, skipping pre-warm")
+            logger.info("[TIMING] Opener already ready for call %s, skipping pre-warm", call_run.call_id)
     else:
         logger.warning(f"twilio_voice: No call run found for conversation {conversationId}")
 
-    webhook_base = os.getenv('WEBHOOK_BASE_URL')
+    gather_url = _twilio_webhook_url("gather", conversationId)
 
     # Hybrid approach: 1s silent wait, then agent says "Hello?" if no speech
     # This avoids the 10-second Twilio speech detection delay
@@ -1328,7 +1618,7 @@ async def twilio_voice(
 <Response>
     <Gather
         input="speech"
-        action="{webhook_base}/twilio/gather?conversationId={conversationId}&amp;turn=0&amp;retry=0"
+        action="{gather_url}&amp;turn=0&amp;retry=0"
         method="POST"
         timeout="1"
         speechTimeout="1"
@@ -1341,7 +1631,7 @@ async def twilio_voice(
 
     <Gather
         input="speech"
-        action="{webhook_base}/twilio/gather?conversationId={conversationId}&amp;turn=0&amp;retry=1"
+        action="{gather_url}&amp;turn=0&amp;retry=1"
         method="POST"
         timeout="5"
         speechTimeout="1"
@@ -1356,15 +1646,17 @@ async def twilio_voice(
     <Hangup/>
 </Response>"""
 
-    twiml_ready_at = datetime.utcnow()
-    logger.info(f"[TIMING] /twilio/voice returning TwiML at {twiml_ready_at.isoformat()} (Hybrid: 1s silent wait, then 'Hello?')")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "[TIMING] /twilio/voice returning TwiML at %s (Hybrid: 1s silent wait, then 'Hello?')",
+            datetime.utcnow().isoformat(),
+        )
 
     return Response(content=twiml, media_type="application/xml")
 
 
 @app.post("/twilio/gather")
 async def twilio_gather(
-    background_tasks: BackgroundTasks,
     conversationId: str = Query(...),
     turn: int = Query(0),
     retry: int = Query(0),
@@ -1383,35 +1675,24 @@ async def twilio_gather(
     - Silence: retry up to 2 times, then hang up
     - Turn limit: after 8 turns, end call politely
     """
-    gather_received_at = datetime.utcnow()
-    logger.info(f"[TIMING] /twilio/gather received at {gather_received_at.isoformat()} - turn={turn}, retry={retry}, speech='{SpeechResult[:50] if SpeechResult else ''}'")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "[TIMING] /twilio/gather received at %s - turn=%s, retry=%s, speech='%s'",
+            datetime.utcnow().isoformat(), turn, retry, SpeechResult[:50] if SpeechResult else "",
+        )
 
-    webhook_base = os.getenv('WEBHOOK_BASE_URL')
+    gather_url = _twilio_webhook_url("gather", conversationId)
 
-    # Find the call run by conversation_id
-    call_run = None
-    for run in CALL_RUNS.values():
-        if run.conversation_id == conversationId:
-            call_run = run
-            break
+    call_run = CALL_RUNS.get_by_conversation(conversationId)
 
     if not call_run:
         logger.error(f"twilio_gather: No call run found for conversation {conversationId}")
-        twiml = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Say voice="en-AU-Wavenet-C" language="en-AU">I'm sorry, something went wrong. Goodbye.</Say>
-    <Hangup/>
-</Response>"""
-        return Response(content=twiml, media_type="application/xml")
+        return Response(content=_TWIML_NO_CALL_RUN, media_type="application/xml")
 
     # Guard: if call is already terminal (race condition / Twilio retry), just hangup
     if call_run.is_terminal:
         logger.info(f"twilio_gather: Call already terminal, hanging up")
-        twiml = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Hangup/>
-</Response>"""
-        return Response(content=twiml, media_type="application/xml")
+        return Response(content=_TWIML_HANGUP, media_type="application/xml")
 
     # Update call_run state
     call_run.turn = turn
@@ -1425,12 +1706,7 @@ async def twilio_gather(
         if new_retry >= 2:
             # Too many silences, hang up
             logger.info(f"Max retries reached, hanging up")
-            twiml = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Say voice="en-AU-Wavenet-C" language="en-AU">I haven't heard anything. Thanks for your time. Goodbye.</Say>
-    <Hangup/>
-</Response>"""
-            return Response(content=twiml, media_type="application/xml")
+            return Response(content=_TWIML_SILENCE_HANGUP, media_type="application/xml")
 
         # Re-prompt (different message for turn 0 vs later turns)
         if turn == 0:
@@ -1442,7 +1718,7 @@ async def twilio_gather(
 <Response>
     <Gather
         input="speech"
-        action="{webhook_base}/twilio/gather?conversationId={conversationId}&amp;turn={turn}&amp;retry={new_retry}"
+        action="{gather_url}&amp;turn={turn}&amp;retry={new_retry}"
         method="POST"
         timeout="6"
         speechTimeout="1"
@@ -1466,12 +1742,7 @@ async def twilio_gather(
     # Check turn limit
     if turn >= 8:
         logger.info(f"Turn limit reached ({turn}), ending call")
-        twiml = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Say voice="en-AU-Wavenet-C" language="en-AU">Thank you so much for your help. I have all the information I need. Have a great day. Goodbye.</Say>
-    <Hangup/>
-</Response>"""
-        return Response(content=twiml, media_type="application/xml")
+        return Response(content=_TWIML_TURN_LIMIT, media_type="application/xml")
 
     # Normal turn - process user speech
     user_speech = SpeechResult.strip()
@@ -1492,7 +1763,7 @@ async def twilio_gather(
 <Response>
     <Gather
         input="speech"
-        action="{webhook_base}/twilio/gather?conversationId={conversationId}&amp;turn={turn}&amp;retry=0"
+        action="{gather_url}&amp;turn={turn}&amp;retry=0"
         method="POST"
         timeout="10"
         speechTimeout="2"
@@ -1501,7 +1772,7 @@ async def twilio_gather(
         language="en-AU">
 
         <Say voice="en-AU-Wavenet-C" language="en-AU">
-            {_escape_xml(HOLD_ACKNOWLEDGEMENT)}
+            {_ESCAPED_HOLD_ACK}
         </Say>
 
     </Gather>
@@ -1510,7 +1781,7 @@ async def twilio_gather(
         I didn't hear anything. Let me know when you're ready.
     </Say>
     <Redirect method="POST">
-        {webhook_base}/twilio/gather?conversationId={conversationId}&amp;turn={turn}&amp;retry=1
+        {gather_url}&amp;turn={turn}&amp;retry=1
     </Redirect>
 </Response>"""
         return Response(content=twiml, media_type="application/xml")
@@ -1519,8 +1790,11 @@ async def twilio_gather(
     if turn == 0 and call_run.pending_agent_reply is not None:
         # Pre-warmed opener is ready - deliver it IMMEDIATELY (no filler, no poll)
         agent_response = call_run.pending_agent_reply
-        deliver_at = datetime.utcnow()
-        logger.info(f"[TIMING] Delivering pre-warmed opener at {deliver_at.isoformat()} for call {call_run.call_id}: {agent_response[:50]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[TIMING] Delivering pre-warmed opener at %s for call %s: %s...",
+                datetime.utcnow().isoformat(), call_run.call_id, agent_response[:50],
+            )
 
         # Clear pending state
         call_run.pending_agent_reply = None
@@ -1539,7 +1813,7 @@ async def twilio_gather(
 <Response>
     <Gather
         input="speech"
-        action="{webhook_base}/twilio/gather?conversationId={conversationId}&amp;turn=1&amp;retry=0"
+        action="{gather_url}&amp;turn=1&amp;retry=0"
         method="POST"
         timeout="6"
         speechTimeout="1"
@@ -1557,39 +1831,31 @@ async def twilio_gather(
         I didn't hear anything.
     </Say>
     <Redirect method="POST">
-        {webhook_base}/twilio/gather?conversationId={conversationId}&amp;turn=1&amp;retry=1
+        {gather_url}&amp;turn=1&amp;retry=1
     </Redirect>
 </Response>"""
         return Response(content=twiml, media_type="application/xml")
 
     elif twilio_service is not None:
         # Start async generation in background
-        background_tasks.add_task(
-            twilio_service.generate_agent_response_async,
-            call_run.call_id,
-            user_speech
-        )
+        _start_agent_generation(call_run.call_id, user_speech)
     else:
         logger.error("twilio_gather: twilio_service is None")
-        twiml = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Say voice="en-AU-Wavenet-C" language="en-AU">I'm sorry, I'm having technical difficulties. Goodbye.</Say>
-    <Hangup/>
-</Response>"""
-        return Response(content=twiml, media_type="application/xml")
+        return Response(content=_TWIML_SERVICE_UNAVAILABLE, media_type="application/xml")
 
     # Select filler phrase based on turn number
-    filler = FILLER_PHRASES[turn % len(FILLER_PHRASES)]
+    filler = _ESCAPED_FILLERS[turn % len(_ESCAPED_FILLERS)]
     next_turn = turn + 1
+    poll_url = _twilio_webhook_url("poll", conversationId)
 
     # Return filler TwiML with redirect to poll endpoint (no pause - faster response)
     twiml = f"""<?xml version="1.0" encoding="UTF-8"?>
 <Response>
     <Say voice="en-AU-Wavenet-C" language="en-AU">
-        {_escape_xml(filler)}
+        {filler}
     </Say>
     <Redirect method="POST">
-        {webhook_base}/twilio/poll?conversationId={conversationId}&amp;turn={next_turn}&amp;attempt=0
+        {poll_url}&amp;turn={next_turn}&amp;attempt=0
     </Redirect>
 </Response>"""
 
@@ -1613,35 +1879,21 @@ async def twilio_poll(
     """
     logger.debug(f"Twilio poll: conversationId={conversationId}, turn={turn}, attempt={attempt}")
 
-    webhook_base = os.getenv('WEBHOOK_BASE_URL')
+    gather_url = _twilio_webhook_url("gather", conversationId)
+    poll_url = _twilio_webhook_url("poll", conversationId)
 
-    # Find the call run by conversation_id
-    call_run = None
-    for run in CALL_RUNS.values():
-        if run.conversation_id == conversationId:
-            call_run = run
-            break
+    call_run = CALL_RUNS.get_by_conversation(conversationId)
 
     if not call_run:
         logger.error(f"twilio_poll: No call run found for conversation {conversationId}")
-        twiml = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Say voice="en-AU-Wavenet-C" language="en-AU">I'm sorry, something went wrong. Goodbye.</Say>
-    <Hangup/>
-</Response>"""
-        return Response(content=twiml, media_type="application/xml")
+        return Response(content=_TWIML_NO_CALL_RUN, media_type="application/xml")
 
     # Hard timeout check - 20 seconds
-    if call_run.pending_started_at:
-        elapsed = (datetime.utcnow() - call_run.pending_started_at).total_seconds()
+    if call_run.pending_started_at is not None:
+        elapsed = time.monotonic() - call_run.pending_started_at
         if elapsed > 20:
             logger.warning(f"Poll timeout exceeded ({elapsed}s) for conversation {conversationId}")
-            twiml = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Say voice="en-AU-Wavenet-C" language="en-AU">I apologize, I'm having technical difficulties. Thank you for your patience. Goodbye.</Say>
-    <Hangup/>
-</Response>"""
-            return Response(content=twiml, media_type="application/xml")
+            return Response(content=_TWIML_POLL_TIMEOUT, media_type="application/xml")
 
     # Check if response is ready
     if call_run.pending_agent_reply is not None:
@@ -1681,7 +1933,7 @@ async def twilio_poll(
 <Response>
     <Gather
         input="speech"
-        action="{webhook_base}/twilio/gather?conversationId={conversationId}&amp;turn={turn}&amp;retry=0"
+        action="{gather_url}&amp;turn={turn}&amp;retry=0"
         method="POST"
         timeout="6"
         speechTimeout="1"
@@ -1699,7 +1951,7 @@ async def twilio_poll(
         I didn't hear anything.
     </Say>
     <Redirect method="POST">
-        {webhook_base}/twilio/gather?conversationId={conversationId}&amp;turn={turn}&amp;retry=1
+        {gather_url}&amp;turn={turn}&amp;retry=1
     </Redirect>
 </Response>"""
         return Response(content=twiml, media_type="application/xml")
@@ -1708,7 +1960,7 @@ async def twilio_poll(
     logger.debug(f"Response not ready, attempt={attempt}")
 
     # Select poll filler based on attempt
-    poll_filler = POLL_FILLER_PHRASES[attempt % len(POLL_FILLER_PHRASES)]
+    poll_filler = _ESCAPED_POLL_FILLERS[attempt % len(_ESCAPED_POLL_FILLERS)]
 
     if attempt >= 3:
         # Reset attempt counter
@@ -1716,10 +1968,10 @@ async def twilio_poll(
         twiml = f"""<?xml version="1.0" encoding="UTF-8"?>
 <Response>
     <Say voice="en-AU-Wavenet-C" language="en-AU">
-        {_escape_xml(poll_filler)}
+        {poll_filler}
     </Say>
     <Redirect method="POST">
-        {webhook_base}/twilio/poll?conversationId={conversationId}&amp;turn={turn}&amp;attempt={next_attempt}
+        {poll_url}&amp;turn={turn}&amp;attempt={next_attempt}
     </Redirect>
 </Response>"""
     else:
@@ -1728,10 +1980,10 @@ async def twilio_poll(
         twiml = f"""<?xml version="1.0" encoding="UTF-8"?>
 <Response>
     <Say voice="en-AU-Wavenet-C" language="en-AU">
-        {_escape_xml(poll_filler)}
+        {poll_filler}
     </Say>
     <Redirect method="POST">
-        {webhook_base}/twilio/poll?conversationId={conversationId}&amp;turn={turn}&amp;attempt={next_attempt}
+        {poll_url}&amp;turn={turn}&amp;attempt={next_attempt}
     </Redirect>
 </Response>"""
 
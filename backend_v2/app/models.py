@@ -1,6 +1,5 @@
 """
 Pydantic models for the Conversation API.
-Python 3.9 compatible - uses typing.List, typing.Dict, typing.Optional
 """
 
 from enum import Enum
@@ -180,6 +179,16 @@ class PlaceDetailsResponse(BaseModel):
     error: Optional[str] = None  # "NO_PHONE", "PLACE_NOT_FOUND", etc.
 
 
+class PlaceDetailsBatchRequest(BaseModel):
+    """Request for details of several places at once."""
+    placeIds: List[str] = Field(min_length=1, max_length=20)
+
+
+class PlaceDetailsBatchResponse(BaseModel):
+    """Details per unique requested placeId, in request order."""
+    results: List[PlaceDetailsResponse]
+
+
 # ============================================================
 # Geocode Models (standalone geocoding endpoint)
 # ============================================================
@@ -16,8 +16,6 @@ RESILIENCE DESIGN:
 - Multi-stage parsing: raw JSON → extract from text → repair retry
 - Deterministic fallback to ASK_QUESTION on any failure
 - Comprehensive logging with conversationId for debugging
-
-Python 3.9 compatible - uses typing.Dict, typing.List, typing.Optional
 """
 
 import json
@@ -48,34 +46,34 @@ logger = logging.getLogger(__name__)
 MAX_ERROR_LOG_CHARS = 2000
 
 # Required slots per agent type for fallback question generation
-REQUIRED_SLOTS: Dict[str, List[Tuple[str, str, str]]] = {
+REQUIRED_SLOTS: Dict[str, Tuple[Tuple[str, str, InputType], ...]] = {
     # (field_name, question_text, input_type)
-    "SICK_CALLER": [
-        ("employer_name", "Who should I call to notify?", "TEXT"),
-        ("employer_phone", "What's their phone number?", "PHONE"),
-        ("caller_name", "What name should I give them?", "TEXT"),
-        ("shift_date", "When is your shift?", "DATE"),
-        ("shift_start_time", "What time does it start?", "TIME"),
-        ("reason_category", "What's the reason?", "CHOICE"),
-    ],
-    "STOCK_CHECKER": [
-        ("retailer_name", "Which retailer should I call?", "TEXT"),
-        ("product_name", "What product are you looking for?", "TEXT"),
-        ("quantity", "How many do you need?", "NUMBER"),
-        ("store_location", "Which suburb or area?", "TEXT"),
-    ],
-    "RESTAURANT_RESERVATION": [
-        ("restaurant_name", "Which restaurant would you like to book?", "TEXT"),
-        ("party_size", "How many people?", "NUMBER"),
-        ("date", "What date?", "DATE"),
-        ("time", "What time?", "TIME"),
-    ],
-    "CANCEL_APPOINTMENT": [
-        ("business_name", "What's the name of the business?", "TEXT"),
-        ("appointment_day", "What day is the appointment?", "DATE"),
-        ("appointment_time", "What time is the appointment?", "TIME"),
-        ("customer_name", "What name is the booking under?", "TEXT"),
-    ],
+    "SICK_CALLER": (
+        ("employer_name", "Who should I call to notify?", InputType.TEXT),
+        ("employer_phone", "What's their phone number?", InputType.PHONE),
+        ("caller_name", "What name should I give them?", InputType.TEXT),
+        ("shift_date", "When is your shift?", InputType.DATE),
+        ("shift_start_time", "What time does it start?", InputType.TIME),
+        ("reason_category", "What's the reason?", InputType.CHOICE),
+    ),
+    "STOCK_CHECKER": (
+        ("retailer_name", "Which retailer should I call?", InputType.TEXT),
+        ("product_name", "What product are you looking for?", InputType.TEXT),
+        ("quantity", "How many do you need?", InputType.NUMBER),
+        ("store_location", "Which suburb or area?", InputType.TEXT),
+    ),
+    "RESTAURANT_RESERVATION": (
+        ("restaurant_name", "Which restaurant would you like to book?", InputType.TEXT),
+        ("party_size", "How many people?", InputType.NUMBER),
+        ("date", "What date?", InputType.DATE),
+        ("time", "What time?", InputType.TIME),
+    ),
+    "CANCEL_APPOINTMENT": (
+        ("business_name", "What's the name of the business?", InputType.TEXT),
+        ("appointment_day", "What day is the appointment?", InputType.DATE),
+        ("appointment_time", "What time is the appointment?", InputType.TIME),
+        ("customer_name", "What name is the booking under?", InputType.TEXT),
+    ),
 }
 
 # All known slot keys per agent type (for detecting slot-only responses)
@@ -147,6 +145,23 @@ class OpenAIService:
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         logger.info(f"OpenAI service configured with model: {self.model}")
 
+    async def close(self):
+        """Close the OpenAI client's pooled HTTP connections."""
+        await self.client.close()
+        logger.info("OpenAI service closed")
+
+    async def warm_up(self):
+        """Open a pooled connection to the OpenAI API ahead of the first turn.
+
+        Lists models (a free, authenticated GET) so the TCP+TLS handshake is
+        done at startup; failures are logged and ignored.
+        """
+        try:
+            await self.client.with_options(timeout=5.0, max_retries=0).models.list()
+            logger.info("OpenAI connection pool warmed")
+        except Exception as e:
+            logger.warning(f"OpenAI warm-up failed: {e}")
+
     async def get_next_turn(
         self,
         agent_type: AgentType,
@@ -451,7 +466,7 @@ class OpenAIService:
             all_slots = extracted_slots
 
         # Find the next missing required slot (considering ALL slots)
-        required = REQUIRED_SLOTS.get(agent_type, [])
+        required = REQUIRED_SLOTS.get(agent_type, ())
         next_slot = None
 
         for field, question_text, input_type in required:
@@ -460,11 +475,7 @@ class OpenAIService:
                 break
 
         if next_slot:
-            field, question_text, input_type_str = next_slot
-            try:
-                input_type = InputType(input_type_str)
-            except ValueError:
-                input_type = InputType.TEXT
+            field, question_text, input_type = next_slot
 
             question = Question(
                 text=question_text,
@@ -642,7 +653,7 @@ RULES:
                 )
 
         # Safety check: don't lose existing required slots
-        required_fields = [f for f, _, _ in REQUIRED_SLOTS.get(agent_type, [])]
+        required_fields = [f for f, _, _ in REQUIRED_SLOTS.get(agent_type, ())]
         for field in required_fields:
             if field in existing_slots and field not in sanitized:
                 # Slot existed before but not in new extraction - preserve it
@@ -787,7 +798,7 @@ RULES:
         Finds the next missing required slot for the agent type.
         """
         # Find the next missing required slot
-        required = REQUIRED_SLOTS.get(agent_type, [])
+        required = REQUIRED_SLOTS.get(agent_type, ())
 
         next_slot = None
         for field, question_text, input_type in required:
@@ -796,11 +807,7 @@ RULES:
                 break
 
         if next_slot:
-            field, question_text, input_type_str = next_slot
-            try:
-                input_type = InputType(input_type_str)
-            except ValueError:
-                input_type = InputType.TEXT
+            field, question_text, input_type = next_slot
 
             question = Question(
                 text=question_text,
@@ -4,14 +4,15 @@ Handles geocoding, text search, and place details.
 
 This service is DETERMINISTIC - NO OpenAI calls.
 All place data comes directly from Google Places API.
-
-Python 3.9 compatible - uses typing.Dict, typing.List, typing.Optional
 """
 
+import asyncio
 import logging
 import math
 import os
-from typing import List, Optional, Tuple
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
 import httpx
 import phonenumbers
@@ -21,6 +22,8 @@ from .models import PlaceCandidate, PlaceSearchResponse, PlaceDetailsResponse, G
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class GooglePlacesService:
     """Service for Google Places API operations."""
@@ -28,19 +31,38 @@ class GooglePlacesService:
     GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
     TEXT_SEARCH_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
     PLACE_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+    # Same host as the APIs above; hit only to open a pooled connection
+    WARM_UP_URL = "https://maps.googleapis.com/"
 
     # Allowed radius values in km
-    ALLOWED_RADII = [25, 50, 100]
+    ALLOWED_RADII = frozenset({25, 50, 100})
 
     # Pass number mapping: radius -> pass number
     RADIUS_TO_PASS = {25: 1, 50: 2, 100: 3}
 
+    # Max concurrent Place Details calls per batch request
+    DETAILS_BATCH_CONCURRENCY = 8
+
+    # Successful geocodes are cached in-process; areas don't move
+    GEOCODE_CACHE_TTL_S = 24 * 60 * 60.0
+    GEOCODE_CACHE_MAX_ENTRIES = 1024
+
     def __init__(self):
         self.api_key = os.getenv("GOOGLE_PLACES_API_KEY")
         if not self.api_key:
             raise RuntimeError("GOOGLE_PLACES_API_KEY is required for Places service")
 
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        # One pooled client for the life of the service. Keep enough idle connections
+        # for a details batch fan-out, and fail fast if Google can't be reached.
+        self.http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        # Key: (area, country) normalized, Value: ((lat, lng, formatted_address), monotonic timestamp)
+        self._geocode_cache: "OrderedDict[Tuple[str, str], Tuple[Tuple[float, float, str], float]]" = OrderedDict()
+        # Upstream calls currently in flight, by request signature. A concurrent
+        # identical request awaits the first one's result instead of calling Google again.
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Future[Optional[Tuple[Any]]]"] = {}
         logger.info("Google Places service initialized")
 
     async def close(self):
@@ -48,6 +70,38 @@ class GooglePlacesService:
         await self.http_client.aclose()
         logger.info("Google Places service closed")
 
+    async def warm_up(self):
+        """Open a pooled connection to Google Maps ahead of the first search.
+
+        The HEAD response itself is irrelevant; failures are logged and ignored.
+        """
+        try:
+            await self.http_client.head(self.WARM_UP_URL, timeout=5.0)
+            logger.info("Google Places connection pool warmed")
+        except Exception as e:
+            logger.warning(f"Google Places warm-up failed: {e}")
+
+    async def _coalesce(self, key: Tuple[Any, ...], fetch: Callable[[], Awaitable[T]]) -> T:
+        """Run fetch() once for concurrent callers sharing the same key."""
+        pending = self._inflight.get(key)
+        if pending is not None:
+            boxed = await asyncio.shield(pending)
+            if boxed is not None:
+                return boxed[0]
+            # First call failed without a result - make our own
+            return await fetch()
+
+        future: "asyncio.Future[Optional[Tuple[Any]]]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        boxed = None
+        try:
+            result = await fetch()
+            boxed = (result,)
+            return result
+        finally:
+            del self._inflight[key]
+            future.set_result(boxed)
+
     async def geocode_area(self, area: str, country: str) -> Optional[Tuple[float, float, str]]:
         """
         Geocode an area name to lat/lng coordinates.
@@ -59,6 +113,28 @@ class GooglePlacesService:
         Returns:
             Tuple of (latitude, longitude, formatted_address) or None if geocoding fails
         """
+        cache_key = (area.strip().casefold(), country.strip().upper())
+        now = time.monotonic()
+        cached = self._geocode_cache.get(cache_key)
+        if cached is not None:
+            coords, timestamp = cached
+            if now - timestamp < self.GEOCODE_CACHE_TTL_S:
+                logger.debug(f"Geocode cache hit for '{area} {country}'")
+                return coords
+            del self._geocode_cache[cache_key]
+
+        return await self._coalesce(
+            ("geocode",) + cache_key,
+            lambda: self._fetch_geocode(area, country, cache_key),
+        )
+
+    async def _fetch_geocode(
+        self,
+        area: str,
+        country: str,
+        cache_key: Tuple[str, str],
+    ) -> Optional[Tuple[float, float, str]]:
+        """Call the Geocoding API and cache a successful result."""
         params = {
             "address": f"{area} {country}",
             "key": self.api_key,
@@ -75,7 +151,9 @@ class GooglePlacesService:
                 lat, lng = location["lat"], location["lng"]
                 formatted_address = result.get("formatted_address", f"{area}, {country}")
                 logger.debug(f"Geocoded '{area} {country}' to ({lat}, {lng})")
-                return (lat, lng, formatted_address)
+                coords = (lat, lng, formatted_address)
+                self._store_geocode(cache_key, coords, time.monotonic())
+                return coords
 
             logger.warning(f"Geocoding failed for '{area} {country}': {data.get('status')}")
             return None
@@ -84,6 +162,18 @@ class GooglePlacesService:
             logger.error(f"Geocoding error for '{area} {country}': {e}")
             return None
 
+    def _store_geocode(
+        self,
+        cache_key: Tuple[str, str],
+        coords: Tuple[float, float, str],
+        now: float,
+    ) -> None:
+        """Cache a successful geocode, evicting the oldest entries beyond the cap."""
+        self._geocode_cache.pop(cache_key, None)
+        self._geocode_cache[cache_key] = (coords, now)
+        while len(self._geocode_cache) > self.GEOCODE_CACHE_MAX_ENTRIES:
+            self._geocode_cache.popitem(last=False)
+
     async def geocode(self, area: str, country: str) -> GeocodeResponse:
         """
         Public geocode endpoint - geocode an area name.
@@ -159,6 +249,19 @@ class GooglePlacesService:
         Returns:
             PlaceSearchResponse with candidates or error
         """
+        return await self._coalesce(
+            ("search", query, area, country, radius_km),
+            lambda: self._text_search(query, area, country, radius_km),
+        )
+
+    async def _text_search(
+        self,
+        query: str,
+        area: str,
+        country: str,
+        radius_km: int
+    ) -> PlaceSearchResponse:
+        """Run the geocode + Text Search calls for text_search."""
         # Note: radius validation is now done in route handler (returns 400)
         # This is a fallback only
         if radius_km not in self.ALLOWED_RADII:
@@ -269,6 +372,47 @@ class GooglePlacesService:
         Returns:
             PlaceDetailsResponse with phone number or error
         """
+        return await self._coalesce(
+            ("details", place_id),
+            lambda: self._place_details(place_id),
+        )
+
+    async def place_details_batch(self, place_ids: List[str]) -> List[PlaceDetailsResponse]:
+        """
+        Get details for several places concurrently.
+
+        Duplicate IDs are fetched once; at most DETAILS_BATCH_CONCURRENCY calls
+        run at a time. A failure for one place becomes an error entry for that
+        place only.
+
+        Args:
+            place_ids: Google Place IDs
+
+        Returns:
+            One PlaceDetailsResponse per unique place ID, in request order
+        """
+        unique_ids = list(dict.fromkeys(place_ids))
+        semaphore = asyncio.Semaphore(self.DETAILS_BATCH_CONCURRENCY)
+
+        async def fetch(place_id: str) -> PlaceDetailsResponse:
+            async with semaphore:
+                return await self.place_details(place_id)
+
+        results = await asyncio.gather(
+            *(fetch(place_id) for place_id in unique_ids),
+            return_exceptions=True,
+        )
+
+        responses: List[PlaceDetailsResponse] = []
+        for place_id, result in zip(unique_ids, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Place details batch error for {place_id}: {result}")
+                result = PlaceDetailsResponse(placeId=place_id, name="", error="PLACES_ERROR")
+            responses.append(result)
+        return responses
+
+    async def _place_details(self, place_id: str) -> PlaceDetailsResponse:
+        """Call the Place Details API for place_details."""
         params = {
             "place_id": place_id,
             "fields": "place_id,name,formatted_address,international_phone_number,formatted_phone_number",
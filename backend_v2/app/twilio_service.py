@@ -8,16 +8,20 @@ This service:
 4. Transcribes recordings via OpenAI Whisper
 5. Analyzes call outcomes via OpenAI
 
-Python 3.9 compatible - uses typing.Dict, typing.List, typing.Optional
+CallRun is a slotted dataclass (slots=True), so this module needs
+Python 3.10+, the floor stated in main.py.
 """
 
+import asyncio
 import json
 import logging
 import os
 import tempfile
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 from openai import AsyncOpenAI
@@ -125,9 +129,13 @@ E) After goodbye, never speak again.
         return PHONE_AGENT_SYSTEM_PROMPT
 
 
-@dataclass
+@dataclass(slots=True)
 class CallRun:
-    """In-memory state for a single call run."""
+    """In-memory state for a single call run.
+
+    Slotted: every webhook turn reads and writes these fields, and a run
+    lives for the whole call and beyond.
+    """
     call_id: str  # Twilio Call SID
     conversation_id: str
     agent_type: str
@@ -155,7 +163,7 @@ class CallRun:
     pending_user_speech: Optional[str] = None
     pending_agent_reply: Optional[str] = None
     is_generating: bool = False
-    pending_started_at: Optional[datetime] = None
+    pending_started_at: Optional[float] = None  # time.monotonic() when generation started
 
     # Repeat question detection
     last_question: Optional[str] = None
@@ -172,8 +180,73 @@ class CallRun:
     cost_currency: Optional[str] = None
 
 
+class CallRunStore(OrderedDict):
+    """Call runs by call_id, also indexed by conversation_id.
+
+    Twilio's voice/gather/poll webhooks only carry the conversationId, so they
+    look runs up through get_by_conversation() instead of scanning every run.
+    The index is kept in step by every write, including direct item assignment.
+    If a conversation has had more than one call, its latest run wins.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._by_conversation: Dict[str, CallRun] = {}
+
+    def __setitem__(self, call_id: str, call_run: CallRun) -> None:
+        previous = super().get(call_id)
+        if previous is not None:
+            self._unindex(previous)
+        super().__setitem__(call_id, call_run)
+        self._by_conversation[call_run.conversation_id] = call_run
+
+    def __delitem__(self, call_id: str) -> None:
+        call_run = self[call_id]
+        super().__delitem__(call_id)
+        self._unindex(call_run)
+
+    def pop(self, call_id: str, *default: Any) -> Any:
+        if call_id not in self:
+            return super().pop(call_id, *default)
+        call_run = self[call_id]
+        del self[call_id]
+        return call_run
+
+    def popitem(self, last: bool = True) -> Tuple[str, CallRun]:
+        call_id, call_run = super().popitem(last=last)
+        self._unindex(call_run)
+        return call_id, call_run
+
+    def clear(self) -> None:
+        super().clear()
+        self._by_conversation.clear()
+
+    def get_by_conversation(self, conversation_id: str) -> Optional[CallRun]:
+        """Get the latest call run for a conversation, if any."""
+        return self._by_conversation.get(conversation_id)
+
+    def _unindex(self, call_run: CallRun) -> None:
+        if self._by_conversation.get(call_run.conversation_id) is call_run:
+            del self._by_conversation[call_run.conversation_id]
+
+
 # In-memory storage for call runs (acceptable for MVP)
-CALL_RUNS: Dict[str, CallRun] = {}
+# Runs are inserted as calls start, so insertion order is also started_at order:
+# the oldest (and first to expire) runs are always at the front.
+CALL_RUNS = CallRunStore()
+CALL_RUN_TTL = timedelta(hours=24)
+CALL_RUNS_MAX_ENTRIES = 10_000
+
+
+def _store_call_run(call_run: CallRun) -> None:
+    """Store a new call run, dropping runs past CALL_RUN_TTL or beyond the cap."""
+    CALL_RUNS[call_run.call_id] = call_run
+    cutoff = call_run.started_at - CALL_RUN_TTL
+    while len(CALL_RUNS) > 1:
+        oldest = next(iter(CALL_RUNS.values()))
+        if oldest.started_at >= cutoff and len(CALL_RUNS) <= CALL_RUNS_MAX_ENTRIES:
+            break
+        CALL_RUNS.popitem(last=False)
 
 
 OUTCOME_ANALYSIS_PROMPT = """Analyze this phone call and extract the outcome.
@@ -487,7 +560,7 @@ class TwilioService:
         """Check if Twilio is properly configured."""
         return self.client is not None
 
-    def start_call(
+    async def start_call(
         self,
         conversation_id: str,
         agent_type: str,
@@ -523,8 +596,10 @@ class TwilioService:
 
         logger.info(f"Starting Twilio call to {phone_e164} for conversation {conversation_id}")
 
-        # Create call via Twilio
-        call = self.client.calls.create(
+        # Create call via Twilio. The SDK's REST call is blocking, so run it in a
+        # worker thread; the CallRun is still stored on the event loop.
+        call = await asyncio.to_thread(
+            self.client.calls.create,
             to=phone_e164,
             from_=self.phone_number,
             url=voice_url,
@@ -548,7 +623,7 @@ class TwilioService:
         )
 
         # Store in memory
-        CALL_RUNS[call.sid] = call_run
+        _store_call_run(call_run)
 
         logger.info(f"Twilio call started: SID={call.sid}, status={call.status}")
         return call_run
@@ -566,12 +641,7 @@ class TwilioService:
         Returns:
             TwiML XML string
         """
-        # Find the call run by conversation_id
-        call_run = None
-        for run in CALL_RUNS.values():
-            if run.conversation_id == conversation_id:
-                call_run = run
-                break
+        call_run = CALL_RUNS.get_by_conversation(conversation_id)
 
         if call_run:
             script = call_run.script_preview
@@ -1069,19 +1139,27 @@ What should you say next?"""
 
         # Mark as generating
         call_run.is_generating = True
-        start_time = datetime.utcnow()
-        call_run.pending_started_at = start_time
+        call_run.pending_started_at = time.monotonic()
         call_run.pending_user_speech = user_speech
         call_run.pending_agent_reply = None
-        logger.info(f"[TIMING] OpenAI generation started at {start_time.isoformat()} for call {call_id}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[TIMING] OpenAI generation started at %s for call %s",
+                datetime.utcnow().isoformat(), call_id,
+            )
 
         try:
             # Call the existing method
             reply = await self.generate_agent_response(call_run, user_speech)
             call_run.pending_agent_reply = reply
-            end_time = datetime.utcnow()
-            elapsed_ms = (end_time - start_time).total_seconds() * 1000
-            logger.info(f"[TIMING] OpenAI generation completed at {end_time.isoformat()} ({elapsed_ms:.0f}ms) for call {call_id}: {reply[:50]}...")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "[TIMING] OpenAI generation completed at %s (%.0fms) for call %s: %s...",
+                    datetime.utcnow().isoformat(),
+                    (time.monotonic() - call_run.pending_started_at) * 1000,
+                    call_id,
+                    reply[:50],
+                )
         except Exception as e:
             logger.error(f"generate_agent_response_async failed for {call_id}: {e}")
             call_run.error = f"agent_generate_failed: {str(e)}"
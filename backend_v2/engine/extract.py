@@ -13,7 +13,7 @@ import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Callable, Dict, Any, Optional, List, Tuple
 import asyncio
 
 from agents.specs import AgentSpec, SlotSpec, InputType, Choice
@@ -280,6 +280,16 @@ def parse_number(num_str: str) -> Optional[int]:
     return None
 
 
+# Input types parsed from the raw message alone (one dict probe instead of an == ladder)
+_MESSAGE_PARSERS: Dict[InputType, Callable[[str], Optional[Any]]] = {
+    InputType.YES_NO: extract_yes_no_value,
+    InputType.PHONE: normalize_phone_number,
+    InputType.DATE: parse_date,
+    InputType.TIME: parse_time,
+    InputType.NUMBER: parse_number,
+}
+
+
 def extract_slot_deterministic(
     user_message: str,
     slot_spec: SlotSpec,
@@ -300,32 +310,16 @@ def extract_slot_deterministic(
         value = extract_choice_value(user_message, slot_spec)
         return (value, value is not None)
 
-    elif input_type == InputType.YES_NO:
-        value = extract_yes_no_value(user_message)
-        return (value, value is not None)
-
-    elif input_type == InputType.PHONE:
-        value = normalize_phone_number(user_message)
-        return (value, value is not None)
-
-    elif input_type == InputType.DATE:
-        value = parse_date(user_message)
-        return (value, value is not None)
-
-    elif input_type == InputType.TIME:
-        value = parse_time(user_message)
-        return (value, value is not None)
-
-    elif input_type == InputType.NUMBER:
-        value = parse_number(user_message)
-        return (value, value is not None)
-
-    elif input_type == InputType.TEXT:
+    if input_type == InputType.TEXT:
         # For TEXT, accept anything non-empty as valid
         value = user_message.strip()
         return (value if value else None, bool(value))
 
-    return (None, False)
+    parser = _MESSAGE_PARSERS.get(input_type)
+    if parser is None:
+        return (None, False)
+    value = parser(user_message)
+    return (value, value is not None)
 
 
 # =============================================================================
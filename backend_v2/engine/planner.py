@@ -14,7 +14,6 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, Any, Optional, List
 import logging
-import re
 
 from agents.specs import AgentSpec, SlotSpec, InputType, PhoneSource
 
@@ -355,27 +354,27 @@ def build_confirmation_card(spec: AgentSpec, slots: Dict[str, Any]) -> Confirmat
     Returns:
         A ConfirmationCard object ready for the response
     """
-    # Format each line by substituting slot values
+    # Format each line from its precompiled (literal, slot_name) plan
     formatted_lines = []
-    for line_template in spec.confirm_lines:
-        formatted_line = line_template
-        # Find all {slot_name} placeholders and replace them
-        placeholders = re.findall(r'\{(\w+)\}', line_template)
+    for plan in spec.get_confirm_plans():
+        parts = []
         skip_line = False
-        for placeholder in placeholders:
+        for literal, placeholder in plan:
+            parts.append(literal)
+            if placeholder is None:
+                continue
             value = slots.get(placeholder)
-            display_value = format_slot_value_for_display(placeholder, value)
 
             # Check if value is empty/not provided/not sure
             if value is None or str(value).strip() == "" or str(value).strip().lower() in ("not sure", "not_sure", "unsure"):
                 skip_line = True
                 break
 
-            formatted_line = formatted_line.replace(f"{{{placeholder}}}", display_value)
+            parts.append(format_slot_value_for_display(placeholder, value))
 
         # Only add line if it has meaningful content
         if not skip_line:
-            formatted_lines.append(formatted_line)
+            formatted_lines.append("".join(parts))
 
     # Generate stable card ID from content hash
     card_content = f"{spec.confirm_title}|{'|'.join(formatted_lines)}"
@@ -20,7 +20,9 @@ os.environ["OPENAI_API_KEY"] = "test-key-for-testing"
 os.environ["OPENAI_MODEL"] = "gpt-4o-mini"
 
 from app.main import app
+from app.models import CallBriefDisclosure, CallBriefFallbacks, CallBriefPlace
 from app.call_brief_service import (
+    CallBriefService,
     compute_missing_required_fields,
     validate_phone_e164,
     is_chain_retailer,
@@ -67,6 +69,21 @@ class TestPhoneValidation:
         """Phone with letters."""
         assert validate_phone_e164("+61abc824583") is False
 
+    def test_invalid_trailing_newline(self):
+        """Trailing newline is rejected."""
+        assert validate_phone_e164("+61731824583\n") is False
+
+    def test_invalid_leading_zero_and_length(self):
+        """Country code can't start with 0; max 15 digits."""
+        assert validate_phone_e164("+0731824583") is False
+        assert validate_phone_e164("+1234567") is True
+        assert validate_phone_e164("+123456789012345") is True
+        assert validate_phone_e164("+1234567890123456") is False
+
+    def test_invalid_non_ascii_digits(self):
+        """Unicode digits are rejected."""
+        assert validate_phone_e164("+٦١٧٣١٨٢٤٥٨٣") is False
+
 
 class TestChainRetailerDetection:
     """Unit tests for chain retailer detection."""
@@ -84,6 +101,12 @@ class TestChainRetailerDetection:
         assert is_chain_retailer("Bob's Electronics") is False
         assert is_chain_retailer("Local Hardware Store") is False
 
+    def test_chain_matched_as_whole_word(self):
+        assert is_chain_retailer("Target Chermside") is True
+        assert is_chain_retailer("Mitre 10 Mega") is True
+        assert is_chain_retailer("Supertargeted Marketing") is False
+        assert is_chain_retailer("Jumbo Hifi") is False
+
 
 class TestMissingFieldsComputation:
     """Unit tests for compute_missing_required_fields (deterministic logic)."""
@@ -154,6 +177,76 @@ class TestMissingFieldsComputation:
         })
         assert len(missing) == 0
 
+    def test_sick_caller_shift_descriptor_satisfies_start_time(self):
+        """Sick caller accepts shift_descriptor in place of shift_start_time."""
+        slots = {
+            "employer_name": "Bunnings",
+            "employer_phone": "+61412345678",
+            "caller_name": "John",
+            "shift_date": "2026-02-01",
+            "reason_category": "SICK",
+        }
+        assert compute_missing_required_fields("SICK_CALLER", slots) == ["shift_start_time"]
+        slots["shift_descriptor"] = "morning shift"
+        assert compute_missing_required_fields("SICK_CALLER", slots) == []
+
+    def test_cancel_appointment_all_missing_in_spec_order(self):
+        """Missing fields follow the AgentSpec slot order."""
+        assert compute_missing_required_fields("CANCEL_APPOINTMENT", {}) == [
+            "business_name",
+            "appointment_day",
+            "appointment_time",
+            "customer_name",
+        ]
+
+    def test_unknown_agent_type_has_no_missing_fields(self):
+        assert compute_missing_required_fields("UNKNOWN_AGENT", {}) == []
+
+
+class TestBuildContext:
+    """Tests for the OpenAI context message and response parsing."""
+
+    def test_context_includes_agent_fallbacks_only(self):
+        service = CallBriefService()
+        place = CallBriefPlace(placeId="p1", businessName="JB Hi-Fi", phoneE164="+61412345678")
+        fallbacks = CallBriefFallbacks(askETA=True, askNearestStore=False, retryIfBusy=True)
+        context = service._build_context(
+            "STOCK_CHECKER", place, {"product_name": "PS5"}, CallBriefDisclosure(), fallbacks
+        )
+        lines = context.split("\n")
+        assert lines[0] == "Agent Type: STOCK_CHECKER"
+        assert "  Address: Not provided" in lines
+        assert 'Slots: {"product_name":"PS5"}' in lines
+        assert lines[-3:] == [
+            "Fallbacks:",
+            "  Ask for ETA if out of stock: True",
+            "  Ask about nearest store: False",
+        ]
+
+    def test_context_unknown_agent_has_no_fallback_lines(self):
+        service = CallBriefService()
+        place = CallBriefPlace(placeId="p2", businessName="Dentist", phoneE164="+61412345678")
+        context = service._build_context(
+            "CANCEL_APPOINTMENT", place, {}, CallBriefDisclosure(), CallBriefFallbacks(retryIfBusy=True)
+        )
+        assert context.endswith("Fallbacks:")
+
+    def test_openai_client_created_lazily(self):
+        service = CallBriefService()
+        assert "client" not in vars(service)
+        client = service.client
+        assert service.client is client
+
+    def test_parse_response_rejects_invalid_json(self):
+        service = CallBriefService()
+        with pytest.raises(ValueError, match="invalid_openai_json"):
+            service._parse_response("{not json")
+
+    def test_parse_response_returns_fields(self):
+        service = CallBriefService()
+        content = '{"objective": "Check stock", "scriptPreview": "Hi", "confirmationChecklist": ["A"]}'
+        assert service._parse_response(content) == ("Check stock", "Hi", ["A"])
+
 
 class TestCallBriefEndpoint:
     """Integration tests for POST /call/brief"""
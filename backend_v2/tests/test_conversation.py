@@ -10,6 +10,7 @@ These tests verify that:
 """
 
 import os
+import sys
 from typing import Any, Dict
 from unittest.mock import AsyncMock, patch
 
@@ -246,6 +247,86 @@ class TestErrorHandling:
         from app.main import lifespan
         assert lifespan is not None
 
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_openai_client(self, monkeypatch):
+        """Test that the shared OpenAI client is closed on lifespan shutdown."""
+        from app import main
+
+        # lifespan assigns module globals; restore them so later tests are unaffected
+        for name in ("openai_service", "places_service", "call_brief_service",
+                     "twilio_service", "call_result_service"):
+            monkeypatch.setattr(main, name, getattr(main, name))
+
+        with patch.object(main.OpenAIService, "close", new_callable=AsyncMock) as mock_close, \
+                patch.object(main.OpenAIService, "warm_up", new_callable=AsyncMock):
+            async with main.lifespan(main.app):
+                mock_close.assert_not_awaited()
+            mock_close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_startup_warms_openai_pool_in_background(self, monkeypatch):
+        """Test that lifespan startup warms the OpenAI pool without waiting on it."""
+        import asyncio
+
+        from app import main
+
+        for name in ("openai_service", "places_service", "call_brief_service",
+                     "twilio_service", "call_result_service"):
+            monkeypatch.setattr(main, name, getattr(main, name))
+
+        warmed = asyncio.Event()
+
+        async def slow_warm_up(self):
+            await asyncio.sleep(0)
+            warmed.set()
+            await asyncio.sleep(60)
+
+        with patch.object(main.OpenAIService, "close", new_callable=AsyncMock), \
+                patch.object(main.OpenAIService, "warm_up", slow_warm_up):
+            async with main.lifespan(main.app):
+                await asyncio.wait_for(warmed.wait(), timeout=1)
+
+    def test_log_handler_defers_traceback_formatting(self):
+        """Test that queued records carry the rendered message but an unformatted traceback."""
+        import logging
+        import queue
+
+        from app.main import _DeferredFormatQueueHandler
+
+        q = queue.SimpleQueue()
+        handler = _DeferredFormatQueueHandler(q)
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = logging.getLogger("test").makeRecord(
+                "test", logging.ERROR, __file__, 0, "Geocode error: %s", ("boom",), sys.exc_info()
+            )
+        handler.emit(record)
+
+        queued = q.get_nowait()
+        assert queued.msg == "Geocode error: boom"
+        assert queued.args is None
+        assert queued.exc_info is not None
+        assert queued.exc_text is None
+
+    def test_log_handler_renders_args_at_call_time(self):
+        """Test that a mutable %s argument is captured before it changes."""
+        import logging
+        import queue
+
+        from app.main import _DeferredFormatQueueHandler
+
+        q = queue.SimpleQueue()
+        handler = _DeferredFormatQueueHandler(q)
+        slots = {"area": "Browns Plains"}
+        record = logging.getLogger("test").makeRecord(
+            "test", logging.INFO, __file__, 0, "slots=%s", (slots,), None
+        )
+        handler.emit(record)
+        slots["area"] = "Logan"
+
+        assert q.get_nowait().getMessage() == "slots={'area': 'Browns Plains'}"
+
     @pytest.mark.asyncio
     async def test_invalid_agent_type_rejected(self, client: AsyncClient):
         """Test that invalid agent type is rejected."""
@@ -266,6 +347,34 @@ class TestErrorHandling:
 class TestResponseSanitization:
     """Tests for response sanitization (auto-repair of invalid responses)."""
 
+    def test_sanitize_well_formed_response_only_merges_slots(self):
+        """Test that a valid response is kept as-is apart from merged extractedData."""
+        from app.main import sanitize_conversation_response
+        from app.models import ConversationResponse, NextAction, Question, InputType
+
+        question = Question(text="What's your name?", field="caller_name", inputType=InputType.TEXT)
+        response = ConversationResponse(
+            assistantMessage="What's your name?",
+            nextAction=NextAction.ASK_QUESTION,
+            question=question,
+            extractedData={"employer_phone": "+61412345678"},
+            aiCallMade=True,
+            aiModel="gpt-4o-mini"
+        )
+
+        sanitized = sanitize_conversation_response(
+            response, "test-conv-ok", "SICK_CALLER", {"employer_name": "Bunnings"}
+        )
+
+        assert sanitized.question is question
+        assert sanitized.assistantMessage == "What's your name?"
+        assert sanitized.extractedData == {
+            "employer_name": "Bunnings",
+            "employer_phone": "+61412345678",
+        }
+        # Original response is not mutated
+        assert response.extractedData == {"employer_phone": "+61412345678"}
+
     def test_sanitize_find_place_without_params(self):
         """Test that FIND_PLACE without placeSearchParams is downgraded."""
         from app.main import sanitize_conversation_response
@@ -305,6 +414,35 @@ class TestResponseSanitization:
         # Should be downgraded to ASK_QUESTION
         assert sanitized.nextAction == NextAction.ASK_QUESTION
 
+    def test_sanitize_confirm_without_card_keeps_question_when_slots_complete(self):
+        """Test that a downgraded CONFIRM keeps the model's question if no slot is missing."""
+        from app.main import sanitize_conversation_response
+        from app.models import ConversationResponse, NextAction, Question, InputType
+
+        question = Question(text="Anything else?", field="note_for_team", inputType=InputType.TEXT)
+        response = ConversationResponse(
+            assistantMessage="Let me confirm that",
+            nextAction=NextAction.CONFIRM,
+            question=question,
+            confirmationCard=None,  # Missing!
+            aiCallMade=True,
+            aiModel="gpt-4o-mini"
+        )
+        slots = {
+            "employer_name": "Bunnings",
+            "employer_phone": "+61412345678",
+            "caller_name": "John",
+            "shift_date": "2026-02-01",
+            "shift_start_time": "09:00",
+            "reason_category": "SICK",
+        }
+
+        sanitized = sanitize_conversation_response(response, "test-conv-2b", "SICK_CALLER", slots)
+
+        assert sanitized.nextAction == NextAction.ASK_QUESTION
+        assert sanitized.question is not None
+        assert sanitized.question.field == "note_for_team"
+
     def test_sanitize_empty_assistant_message(self):
         """Test that empty assistantMessage is replaced with fallback."""
         from app.main import sanitize_conversation_response
@@ -859,6 +997,30 @@ class TestClientActionHandling:
         assert data["question"] is not None
         assert data["question"]["field"] == "correction"
 
+    @pytest.mark.asyncio
+    async def test_client_actions_do_not_leak_slots_between_turns(self, client: AsyncClient):
+        """Test that slots from one CONFIRM/REJECT turn never show up in another."""
+        for action in ("CONFIRM", "REJECT"):
+            first = await client.post("/conversation/next", json={
+                "conversationId": f"leak-test-{action}-1",
+                "agentType": "SICK_CALLER",
+                "userMessage": "",
+                "slots": {"employer_name": "Bunnings"},
+                "messageHistory": [],
+                "clientAction": action,
+            })
+            second = await client.post("/conversation/next", json={
+                "conversationId": f"leak-test-{action}-2",
+                "agentType": "SICK_CALLER",
+                "userMessage": "",
+                "slots": {},
+                "messageHistory": [],
+                "clientAction": action,
+            })
+
+            assert first.json()["extractedData"] == {"employer_name": "Bunnings"}
+            assert second.json()["extractedData"] == {}
+
     @pytest.mark.asyncio
     async def test_no_client_action_calls_openai(self, client: AsyncClient):
         """Test that normal requests (no clientAction) call OpenAI."""
@@ -952,6 +1114,35 @@ class TestIdempotency:
         assert data1["nextAction"] == "COMPLETE"
         assert data2["nextAction"] == "ASK_QUESTION"
 
+    def test_store_evicts_oldest_beyond_cap(self, monkeypatch):
+        """Test that the store drops the oldest entries once over the cap."""
+        from unittest.mock import MagicMock
+        from app import main
+
+        monkeypatch.setattr(main, "_idempotency_store", main.OrderedDict())
+        monkeypatch.setattr(main, "_IDEMPOTENCY_MAX_ENTRIES", 3)
+        for key in ("a", "b", "c", "d"):
+            main._store_idempotent_response(key, MagicMock())
+
+        assert list(main._idempotency_store) == ["b", "c", "d"]
+
+    def test_store_sweeps_expired_entries_from_front(self, monkeypatch):
+        """Test that expired entries are dropped without scanning the whole store."""
+        import time
+        from unittest.mock import MagicMock
+        from app import main
+
+        monkeypatch.setattr(main, "_idempotency_store", main.OrderedDict())
+        stale = time.monotonic() - main._IDEMPOTENCY_TTL_S - 1
+        main._idempotency_store["old1"] = (MagicMock(), stale)
+        main._idempotency_store["old2"] = (MagicMock(), stale)
+        fresh = MagicMock()
+        main._store_idempotent_response("fresh", fresh)
+
+        assert list(main._idempotency_store) == ["fresh"]
+        assert main._get_idempotent_response("fresh") is fresh
+        assert main._get_idempotent_response("old1") is None
+
 
 class TestSlotPersistence:
     """Tests for slot persistence across turns."""
@@ -1033,6 +1224,19 @@ class TestSlotPersistence:
         # Should ask for shift_start_time (next unfilled)
         assert response.question.field == "shift_start_time"
 
+    def test_endpoint_next_missing_slot_skips_empty_values(self):
+        """Test that the endpoint's next-slot lookup treats empty values as missing."""
+        from app.main import _get_next_missing_slot
+        from app.models import InputType
+
+        slots = {"employer_name": "Bunnings", "employer_phone": ""}
+
+        field, _, input_type = _get_next_missing_slot("SICK_CALLER", slots)
+
+        assert field == "employer_phone"
+        assert input_type is InputType.PHONE
+        assert _get_next_missing_slot("UNKNOWN_AGENT", {}) is None
+
     def test_build_slot_only_response_merges_slots_correctly(self):
         """Test that _build_slot_only_response considers all slots for next question."""
         from app.openai_service import OpenAIService
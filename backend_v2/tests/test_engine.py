@@ -137,12 +137,29 @@ class TestAgentSpecs:
         assert "appointment_day" in required_names
         assert "customer_name" in required_names
 
+    def test_registry_is_read_only(self):
+        """Verify AGENTS can't be mutated after import."""
+        with pytest.raises(TypeError):
+            AGENTS["NEW_AGENT"] = SICK_CALLER_SPEC
+
     def test_invalid_agent_type_raises(self):
         """Verify unknown agent type raises ValueError."""
         with pytest.raises(ValueError) as exc_info:
             get_agent_spec("INVALID_AGENT")
         assert "Unknown agent type" in str(exc_info.value)
 
+    def test_slot_lookups_use_precomputed_index(self):
+        """Verify cached slot partitions match slots_in_order and can't be mutated via getters."""
+        spec = get_agent_spec("RESTAURANT_RESERVATION")
+        assert spec.get_slot_by_name("date") is spec.slots_in_order[2]
+        assert spec.get_slot_by_name("not_a_slot") is None
+        assert spec.get_slot_names() == [s.name for s in spec.slots_in_order]
+        assert spec.get_optional_slots() == [s for s in spec.slots_in_order if not s.required]
+
+        names = spec.get_required_slot_names()
+        names.append("mutated")
+        assert "mutated" not in spec.get_required_slot_names()
+
     def test_slot_spec_get_quick_replies_choice(self):
         """Verify CHOICE slot returns quick replies."""
         spec = get_agent_spec("SICK_CALLER")
@@ -170,6 +187,28 @@ class TestAgentSpecs:
         qr = name_slot.get_quick_replies()
         assert qr is None
 
+    def test_slot_spec_choices_are_immutable(self):
+        """Choices are stored as a tuple of frozen Choice objects."""
+        slot = SlotSpec(
+            name="size",
+            required=True,
+            input_type=InputType.CHOICE,
+            prompt="Size?",
+            choices=[Choice(label="Small", value="S")],
+        )
+        assert slot.choices == (Choice(label="Small", value="S"),)
+        with pytest.raises(AttributeError):
+            slot.choices[0].value = "L"
+
+    def test_slot_spec_quick_replies_are_cached_and_read_only(self):
+        """Quick replies are built once per slot and cannot be mutated by callers."""
+        spec = get_agent_spec("SICK_CALLER")
+        reason_slot = spec.get_slot_by_name("reason_category")
+        qr = reason_slot.get_quick_replies()
+        assert reason_slot.get_quick_replies() is qr
+        with pytest.raises(TypeError):
+            qr[0]["label"] = "mutated"
+
 
 # =============================================================================
 # PLANNER TESTS
@@ -358,6 +397,21 @@ class TestBuildConfirmationCard:
         card = build_confirmation_card(spec, slots)
         assert "Reason: Mental health day" in card.lines
 
+    def test_multi_placeholder_line_rendered_from_plan(self):
+        """Lines with several placeholders render fully and skip when any is missing."""
+        spec = get_agent_spec("SICK_CALLER")
+        slots = {
+            "employer_name": "Bunnings",
+            "shift_date": "2026-02-01",
+            "shift_start_time": "09:00",
+        }
+        card = build_confirmation_card(spec, slots)
+        assert any(line.startswith("Shift: ") and "09:00" in line for line in card.lines)
+
+        del slots["shift_start_time"]
+        card = build_confirmation_card(spec, slots)
+        assert not any(line.startswith("Shift: ") for line in card.lines)
+
 
 class TestBuildPlaceSearchParams:
     """Tests for build_place_search_params function."""
@@ -849,3 +903,179 @@ class TestV2EndpointIntegration:
             assert process_conversation_v2 is not None
         except ImportError:
             pytest.skip("conversation_v2 module not found")
+
+
+class TestV2IdempotencyStore:
+    """Tests for the bounded v2 idempotency store."""
+
+    @pytest.fixture(autouse=True)
+    def clean_store(self):
+        from app import conversation_v2
+        conversation_v2._idempotency_store_v2.clear()
+        yield conversation_v2
+        conversation_v2._idempotency_store_v2.clear()
+
+    def test_store_evicts_oldest_beyond_cap(self, clean_store, monkeypatch):
+        cv2 = clean_store
+        monkeypatch.setattr(cv2, "_IDEMPOTENCY_MAX_ENTRIES", 3)
+        for key in ("a", "b", "c", "d"):
+            cv2._store_idempotent_response(key, MagicMock())
+        assert list(cv2._idempotency_store_v2) == ["b", "c", "d"]
+
+    def test_get_sweeps_expired_oldest_entries(self, clean_store):
+        import time
+        cv2 = clean_store
+        stale = time.monotonic() - cv2._IDEMPOTENCY_TTL_S - 1
+        cv2._idempotency_store_v2["old1"] = (MagicMock(), stale)
+        cv2._idempotency_store_v2["old2"] = (MagicMock(), stale)
+        fresh = MagicMock()
+        cv2._store_idempotent_response("fresh", fresh)
+
+        assert cv2._get_idempotent_response("fresh") is fresh
+        assert list(cv2._idempotency_store_v2) == ["fresh"]
+
+    def test_store_sweeps_expired_oldest_entries(self, clean_store):
+        import time
+        cv2 = clean_store
+        stale = time.monotonic() - cv2._IDEMPOTENCY_TTL_S - 1
+        cv2._idempotency_store_v2["old1"] = (MagicMock(), stale)
+        cv2._idempotency_store_v2["old2"] = (MagicMock(), stale)
+        cv2._store_idempotent_response("fresh", MagicMock())
+
+        assert list(cv2._idempotency_store_v2) == ["fresh"]
+
+    async def test_concurrent_duplicate_key_waits_for_first_turn(self, clean_store, monkeypatch):
+        import asyncio
+        from app.models import ConversationRequest
+        cv2 = clean_store
+        calls = []
+
+        async def slow_extract(**kwargs):
+            calls.append(kwargs["user_message"])
+            await asyncio.sleep(0.01)
+            return ExtractionResult(extracted_data={"employer_name": "Bunnings"})
+
+        monkeypatch.setattr(cv2, "extract_slots", slow_extract)
+        request = ConversationRequest(
+            conversationId="c1",
+            agentType="SICK_CALLER",
+            userMessage="Bunnings",
+            idempotencyKey="dup-key",
+            currentQuestionSlotName="employer_name",
+        )
+
+        first, second = await asyncio.gather(
+            cv2.process_conversation_v2(request),
+            cv2.process_conversation_v2(request),
+        )
+        assert calls == ["Bunnings"]
+        assert second is first
+        assert cv2._idempotency_inflight_v2 == {}
+
+    async def test_concurrent_duplicate_key_runs_own_turn_when_first_fails(self, clean_store, monkeypatch):
+        import asyncio
+        from app.models import ConversationRequest
+        cv2 = clean_store
+        calls = []
+
+        async def flaky_extract(**kwargs):
+            calls.append(kwargs["user_message"])
+            await asyncio.sleep(0.01)
+            if len(calls) == 1:
+                raise RuntimeError("upstream down")
+            return ExtractionResult(extracted_data={"employer_name": "Bunnings"})
+
+        monkeypatch.setattr(cv2, "extract_slots", flaky_extract)
+        monkeypatch.setattr(cv2, "_metrics", cv2._V2Metrics())
+        request = ConversationRequest(
+            conversationId="c1",
+            agentType="SICK_CALLER",
+            userMessage="Bunnings",
+            idempotencyKey="dup-key",
+            currentQuestionSlotName="employer_name",
+        )
+
+        first, second = await asyncio.gather(
+            cv2.process_conversation_v2(request),
+            cv2.process_conversation_v2(request),
+        )
+        assert calls == ["Bunnings", "Bunnings"]
+        assert second is not first
+        assert second.extractedData["employer_name"] == "Bunnings"
+        assert cv2._metrics.idempotency_hits == 0
+        assert cv2._idempotency_inflight_v2 == {}
+
+
+class TestV2Metrics:
+    """Tests for the v2 in-memory metrics counters."""
+
+    def test_action_counts(self):
+        from app.conversation_v2 import _V2Metrics
+        metrics = _V2Metrics()
+        metrics.record_request(llm_used=False, next_action=NextAction.CONFIRM)
+        metrics.record_request(llm_used=True, next_action=NextAction.ASK_QUESTION)
+        metrics.record_request(llm_used=False, next_action=NextAction.ASK_QUESTION, fallback=True)
+        assert metrics.confirm_actions == 1
+        assert metrics.ask_question_actions == 2
+        assert metrics.complete_actions == 0
+        assert metrics.llm_calls == 1
+        assert metrics.fallback_used == 1
+
+
+class TestV2FallbackResponse:
+    """Tests for the v2 error fallback response."""
+
+    def test_fallback_asks_next_missing_slot(self):
+        from app.conversation_v2 import _create_fallback_response
+        from app.models import ConversationRequest, NextAction as ApiNextAction
+        request = ConversationRequest(
+            conversationId="c1",
+            agentType="SICK_CALLER",
+            userMessage="hi",
+            slots={"employer_name": "Bunnings"},
+        )
+        response = _create_fallback_response(request)
+        assert response.nextAction == ApiNextAction.ASK_QUESTION
+        assert response.question.field == "employer_phone"
+        assert response.aiModel == "fallback"
+        assert response.agentMeta.title == "Call in Sick"
+
+    def test_ultimate_fallback_reuses_static_parts(self, monkeypatch):
+        from app import conversation_v2
+        from app.models import ConversationRequest
+
+        def broken(agent_type):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(conversation_v2, "_spec_and_meta", broken)
+        request = ConversationRequest(conversationId="c1", agentType="SICK_CALLER", userMessage="hi")
+        first = conversation_v2._create_fallback_response(request)
+        second = conversation_v2._create_fallback_response(request)
+        assert first.question.field == "unknown"
+        assert first.agentMeta.title == "Assistant"
+        assert first.agentMeta is second.agentMeta
+        assert first.extractedData == {}
+
+
+class TestV2RejectPath:
+    """Tests for the v2 REJECT client action."""
+
+    async def test_reject_without_slots_uses_cached_first_question(self, monkeypatch):
+        from app import conversation_v2
+        from app.models import ClientAction as ApiClientAction, ConversationRequest
+
+        request = ConversationRequest(
+            conversationId="c1",
+            agentType="SICK_CALLER",
+            userMessage="",
+            clientAction=ApiClientAction.REJECT,
+        )
+        first = await conversation_v2.process_conversation_v2(request)
+
+        def fail(**kwargs):
+            raise AssertionError("planner should not run for an empty-slot REJECT")
+
+        monkeypatch.setattr(conversation_v2, "decide_next_action", fail)
+        second = await conversation_v2.process_conversation_v2(request)
+        assert first.question.field == second.question.field == "employer_name"
+        assert second.assistantMessage.startswith("No problem!")
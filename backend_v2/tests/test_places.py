@@ -0,0 +1,220 @@
+"""
+Tests for the Google Places service.
+
+These tests verify that:
+1. Successful geocodes are cached per normalized (area, country)
+2. Failed geocodes are not cached
+3. Text search reuses the cached geocode
+4. Concurrent identical geocode/search/details calls share one upstream call
+5. Batch place details are deduplicated, bounded, and fail per item
+6. Connection warm-up never raises
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from app.models import PlaceDetailsBatchRequest, PlaceDetailsResponse
+from app.places_service import GooglePlacesService
+
+
+def _http_response(data):
+    response = MagicMock()
+    response.json.return_value = data
+    response.raise_for_status.return_value = None
+    return response
+
+
+GEOCODE_OK = {
+    "status": "OK",
+    "results": [{
+        "geometry": {"location": {"lat": -27.66, "lng": 153.05}},
+        "formatted_address": "Browns Plains QLD 4118, Australia",
+    }],
+}
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setenv("GOOGLE_PLACES_API_KEY", "test-places-key")
+    svc = GooglePlacesService()
+    svc.http_client = MagicMock()
+    svc.http_client.get = AsyncMock(return_value=_http_response(GEOCODE_OK))
+    return svc
+
+
+class TestGeocodeCache:
+    """Tests for the in-process geocode cache."""
+
+    async def test_repeat_geocode_hits_cache(self, service):
+        first = await service.geocode_area("Browns Plains", "AU")
+        second = await service.geocode_area("  browns plains ", "au")
+
+        assert first == second == (-27.66, 153.05, "Browns Plains QLD 4118, Australia")
+        assert service.http_client.get.await_count == 1
+
+    async def test_failed_geocode_not_cached(self, service):
+        service.http_client.get.return_value = _http_response({"status": "ZERO_RESULTS"})
+
+        assert await service.geocode_area("Nowhere", "AU") is None
+        assert await service.geocode_area("Nowhere", "AU") is None
+        assert service.http_client.get.await_count == 2
+
+    async def test_expired_entry_refetched(self, service):
+        await service.geocode_area("Browns Plains", "AU")
+        key = ("browns plains", "AU")
+        coords, _ = service._geocode_cache[key]
+        service._geocode_cache[key] = (coords, -service.GEOCODE_CACHE_TTL_S)
+
+        await service.geocode_area("Browns Plains", "AU")
+
+        assert service.http_client.get.await_count == 2
+
+    async def test_cache_evicts_oldest_beyond_cap(self, service, monkeypatch):
+        monkeypatch.setattr(GooglePlacesService, "GEOCODE_CACHE_MAX_ENTRIES", 2)
+        for area in ("A", "B", "C"):
+            await service.geocode_area(area, "AU")
+
+        assert list(service._geocode_cache) == [("b", "AU"), ("c", "AU")]
+
+    async def test_text_search_reuses_cached_geocode(self, service):
+        await service.geocode_area("Browns Plains", "AU")
+        service.http_client.get.return_value = _http_response({"status": "ZERO_RESULTS", "results": []})
+
+        result = await service.text_search("JB Hi-Fi", "Browns Plains", "AU", 25)
+
+        assert result.error is None
+        assert result.candidates == []
+        # One geocode + one text search, no second geocode
+        assert service.http_client.get.await_count == 2
+
+
+class TestInflightCoalescing:
+    """Tests for coalescing concurrent identical upstream calls."""
+
+    @staticmethod
+    def _slow_get(payload):
+        async def get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return _http_response(payload)
+        return AsyncMock(side_effect=get)
+
+    async def test_concurrent_geocodes_share_one_call(self, service):
+        service.http_client.get = self._slow_get(GEOCODE_OK)
+
+        results = await asyncio.gather(
+            service.geocode_area("Browns Plains", "AU"),
+            service.geocode_area("browns plains", "AU"),
+        )
+
+        assert results[0] == results[1]
+        assert service.http_client.get.await_count == 1
+        assert service._inflight == {}
+
+    async def test_concurrent_details_share_one_call(self, service):
+        service.http_client.get = self._slow_get({"status": "NOT_FOUND"})
+
+        first, second = await asyncio.gather(
+            service.place_details("place-1"),
+            service.place_details("place-1"),
+        )
+
+        assert second is first
+        assert first.error == "PLACE_NOT_FOUND"
+        assert service.http_client.get.await_count == 1
+
+    async def test_waiter_fetches_itself_when_first_call_fails(self, service):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return "ok"
+
+        first, second = await asyncio.gather(
+            service._coalesce(("k",), fetch),
+            service._coalesce(("k",), fetch),
+            return_exceptions=True,
+        )
+
+        assert isinstance(first, RuntimeError)
+        assert second == "ok"
+        assert len(calls) == 2
+
+
+class TestPlaceDetailsBatch:
+    """Tests for bounded-concurrency batch place details."""
+
+    async def test_batch_dedupes_and_keeps_request_order(self, service):
+        seen = []
+
+        async def details(place_id):
+            seen.append(place_id)
+            return PlaceDetailsResponse(placeId=place_id, name=place_id.upper())
+
+        service.place_details = details
+
+        results = await service.place_details_batch(["b", "a", "b"])
+
+        assert [r.placeId for r in results] == ["b", "a"]
+        assert sorted(seen) == ["a", "b"]
+
+    async def test_batch_caps_concurrency(self, service, monkeypatch):
+        monkeypatch.setattr(GooglePlacesService, "DETAILS_BATCH_CONCURRENCY", 2)
+        active = 0
+        peak = 0
+
+        async def details(place_id):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return PlaceDetailsResponse(placeId=place_id, name="")
+
+        service.place_details = details
+
+        await service.place_details_batch([str(i) for i in range(6)])
+
+        assert peak == 2
+
+    async def test_batch_failure_is_per_item(self, service):
+        async def details(place_id):
+            if place_id == "bad":
+                raise RuntimeError("boom")
+            return PlaceDetailsResponse(placeId=place_id, name="Ok", phoneE164="+61731824583")
+
+        service.place_details = details
+
+        good, bad = await service.place_details_batch(["good", "bad"])
+
+        assert good.error is None
+        assert bad.placeId == "bad"
+        assert bad.error == "PLACES_ERROR"
+
+    def test_batch_request_limits(self):
+        with pytest.raises(ValidationError):
+            PlaceDetailsBatchRequest(placeIds=[])
+        with pytest.raises(ValidationError):
+            PlaceDetailsBatchRequest(placeIds=[str(i) for i in range(21)])
+
+
+class TestWarmUp:
+    """Tests for startup connection warm-up."""
+
+    async def test_warm_up_hits_maps_host(self, service):
+        service.http_client.head = AsyncMock()
+
+        await service.warm_up()
+
+        service.http_client.head.assert_awaited_once()
+        assert service.http_client.head.await_args.args[0] == GooglePlacesService.WARM_UP_URL
+
+    async def test_warm_up_swallows_errors(self, service):
+        service.http_client.head = AsyncMock(side_effect=RuntimeError("unreachable"))
+
+        await service.warm_up()
@@ -5,10 +5,13 @@ These tests verify that:
 1. POST /call/start validates phone E.164 format
 2. POST /call/start returns 503 when Twilio not configured
 3. GET /call/status/{call_id} returns 404 for unknown calls
-4. POST /twilio/voice returns valid TwiML
-5. POST /twilio/status handles status updates
+4. GET /call/status/{call_id}/stream pushes status changes as SSE
+5. POST /twilio/voice returns valid TwiML
+6. POST /twilio/status handles status updates
 """
 
+import asyncio
+import json
 import os
 from typing import Any, Dict
 
@@ -150,6 +153,112 @@ class TestCallStatusEndpoint:
         assert data["outcome"]["success"] is True
         assert data["outcome"]["extractedFacts"]["inStock"] is True
 
+    @pytest.mark.asyncio
+    async def test_unchanged_status_returns_304(self, client: AsyncClient):
+        """Test that a matching If-None-Match gets 304 until the call run changes."""
+        call_run = CallRun(
+            call_id="test-call-etag",
+            conversation_id="conv-3",
+            agent_type="STOCK_CHECKER",
+            phone_e164="+61731824583",
+            script_preview="Hello, test script.",
+            status="ringing",
+        )
+        CALL_RUNS["test-call-etag"] = call_run
+
+        first = await client.get("/call/status/test-call-etag")
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+
+        unchanged = await client.get("/call/status/test-call-etag", headers={"If-None-Match": etag})
+        assert unchanged.status_code == 304
+        assert unchanged.headers["etag"] == etag
+        assert unchanged.content == b""
+
+        call_run.status = "in-progress"
+        changed = await client.get("/call/status/test-call-etag", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["status"] == "in-progress"
+
+
+class TestCallStatusStream:
+    """Tests for GET /call/status/{call_id}/stream"""
+
+    @staticmethod
+    def _events(response) -> list:
+        return [
+            json.loads(line[len("data: "):])
+            for line in response.text.split("\n\n")
+            if line.startswith("data: ")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unknown_call_returns_404(self, client: AsyncClient):
+        """Test that unknown call_id returns 404 before streaming."""
+        response = await client.get("/call/status/unknown-call-id/stream")
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_streams_changes_until_call_ends(self, client: AsyncClient, monkeypatch):
+        """Test that each status change is pushed once and the stream ends on a terminal status."""
+        from app import main
+
+        monkeypatch.setattr(main, "CALL_STATUS_STREAM_INTERVAL_S", 0.01)
+        call_run = CallRun(
+            call_id="test-call-stream",
+            conversation_id="conv-4",
+            agent_type="STOCK_CHECKER",
+            phone_e164="+61731824583",
+            script_preview="Hello, test script.",
+            status="ringing",
+        )
+        CALL_RUNS["test-call-stream"] = call_run
+
+        async def advance():
+            await asyncio.sleep(0.05)
+            call_run.status = "in-progress"
+            await asyncio.sleep(0.05)
+            call_run.status = "busy"
+
+        updater = asyncio.create_task(advance())
+        response = await client.get("/call/status/test-call-stream/stream")
+        await updater
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert [e["status"] for e in self._events(response)] == ["ringing", "in-progress", "busy"]
+
+    @pytest.mark.asyncio
+    async def test_completed_call_streams_until_outcome(self, client: AsyncClient, monkeypatch):
+        """Test that a completed call keeps streaming until post-call processing sets an outcome."""
+        from app import main
+
+        monkeypatch.setattr(main, "CALL_STATUS_STREAM_INTERVAL_S", 0.01)
+        call_run = CallRun(
+            call_id="test-call-stream-2",
+            conversation_id="conv-5",
+            agent_type="STOCK_CHECKER",
+            phone_e164="+61731824583",
+            script_preview="Hello, test script.",
+            status="completed",
+        )
+        CALL_RUNS["test-call-stream-2"] = call_run
+
+        async def finish():
+            await asyncio.sleep(0.05)
+            call_run.outcome = {"success": True}
+
+        updater = asyncio.create_task(finish())
+        response = await client.get("/call/status/test-call-stream-2/stream")
+        await updater
+
+        events = self._events(response)
+        assert len(events) == 2
+        assert events[0]["outcome"] is None
+        assert events[1]["outcome"] == {"success": True}
+
 
 class TestTwilioVoiceWebhook:
     """Tests for POST /twilio/voice webhook"""
@@ -186,6 +295,15 @@ class TestTwilioVoiceWebhook:
         # New behavior: Returns Gather-based TwiML even for unknown conversations
         assert "<Gather" in response.text
 
+    @pytest.mark.asyncio
+    async def test_conversation_id_encoded_in_callback_urls(self, client: AsyncClient):
+        """Test that the conversationId is percent-encoded so the TwiML stays well-formed."""
+        response = await client.post("/twilio/voice", params={"conversationId": "a&b<c"})
+
+        assert response.status_code == 200
+        assert "conversationId=a%26b%3Cc&amp;turn=0&amp;retry=0" in response.text
+        assert "a&b" not in response.text
+
 
 class TestTwilioStatusWebhook:
     """Tests for POST /twilio/status webhook"""
@@ -313,10 +431,112 @@ class TestTwilioServiceUnit:
         assert "&amp;" in twiml
         assert "<product>" not in twiml  # Should be escaped
 
+    def test_call_runs_drop_expired_and_over_cap(self, monkeypatch):
+        """Test that storing a new run evicts expired runs and runs beyond the cap."""
+        from datetime import datetime, timedelta
+        from app import twilio_service
+
+        def make_run(call_id, started_at):
+            return CallRun(
+                call_id=call_id,
+                conversation_id=f"conv-{call_id}",
+                agent_type="STOCK_CHECKER",
+                phone_e164="+61731824583",
+                script_preview="Hello",
+                started_at=started_at,
+            )
+
+        now = datetime.utcnow()
+        twilio_service._store_call_run(make_run("stale", now - timedelta(hours=25)))
+        twilio_service._store_call_run(make_run("a", now))
+        assert list(CALL_RUNS) == ["a"]
+
+        monkeypatch.setattr(twilio_service, "CALL_RUNS_MAX_ENTRIES", 2)
+        twilio_service._store_call_run(make_run("b", now))
+        twilio_service._store_call_run(make_run("c", now))
+        assert list(CALL_RUNS) == ["b", "c"]
+
+    def test_call_runs_indexed_by_conversation(self, monkeypatch):
+        """Test that the conversation index follows stores, overwrites and evictions."""
+        from app import twilio_service
+
+        def make_run(call_id, conversation_id):
+            return CallRun(
+                call_id=call_id,
+                conversation_id=conversation_id,
+                agent_type="STOCK_CHECKER",
+                phone_e164="+61731824583",
+                script_preview="Hello",
+            )
+
+        first = make_run("CA1", "conv-a")
+        CALL_RUNS["CA1"] = first
+        assert CALL_RUNS.get_by_conversation("conv-a") is first
+
+        # A retried call in the same conversation takes over the index
+        retry = make_run("CA2", "conv-a")
+        twilio_service._store_call_run(retry)
+        assert CALL_RUNS.get_by_conversation("conv-a") is retry
+
+        # Evicting the older run leaves the newer run indexed
+        monkeypatch.setattr(twilio_service, "CALL_RUNS_MAX_ENTRIES", 1)
+        twilio_service._store_call_run(make_run("CA3", "conv-b"))
+        assert list(CALL_RUNS) == ["CA3"]
+        assert CALL_RUNS.get_by_conversation("conv-a") is None
+        assert CALL_RUNS.get_by_conversation("conv-b").call_id == "CA3"
+
+        CALL_RUNS["CA3"] = make_run("CA3", "conv-c")
+        assert CALL_RUNS.get_by_conversation("conv-b") is None
+        assert CALL_RUNS.pop("CA3").conversation_id == "conv-c"
+        assert CALL_RUNS.get_by_conversation("conv-c") is None
+
+    @pytest.mark.asyncio
+    async def test_start_call_creates_call_off_event_loop(self, monkeypatch):
+        """Test that the blocking Twilio REST call runs in a worker thread."""
+        import threading
+        from unittest.mock import MagicMock
+
+        service = get_twilio_service()
+        monkeypatch.setattr(service, "webhook_base_url", "https://example.test")
+        monkeypatch.setattr(type(service), "is_configured", property(lambda self: True))
+        loop_thread = threading.get_ident()
+        create_threads = []
+
+        def create(**kwargs):
+            create_threads.append(threading.get_ident())
+            return MagicMock(sid="CA-thread-test", status="queued")
+
+        monkeypatch.setattr(service, "client", MagicMock())
+        service.client.calls.create.side_effect = create
+
+        call_run = await service.start_call(
+            conversation_id="conv-thread",
+            agent_type="STOCK_CHECKER",
+            phone_e164="+61731824583",
+            script_preview="Hello",
+            slots={},
+        )
+
+        assert call_run.call_id == "CA-thread-test"
+        assert CALL_RUNS["CA-thread-test"] is call_run
+        assert create_threads and create_threads[0] != loop_thread
+
 
 class TestTerminalResponseHangup:
     """Tests for terminal response (goodbye) handling"""
 
+    def test_goodbye_keywords_cover_every_phrase(self):
+        """Test that the keyword pre-filter can't reject a goodbye phrase."""
+        from app.main import _GOODBYE_KEYWORDS, _GOODBYE_PHRASES, _is_terminal_text
+
+        for phrase in _GOODBYE_PHRASES:
+            assert any(keyword in phrase for keyword in _GOODBYE_KEYWORDS), phrase
+
+        assert _is_terminal_text("Thanks for your time. Goodbye!")
+        assert _is_terminal_text("Take care—bye.")
+        assert not _is_terminal_text("Let me check that for you.")
+        assert not _is_terminal_text("Do you have time to check? Bye")
+
     @pytest.mark.asyncio
     async def test_terminal_response_hangup(self, client: AsyncClient):
         """Test that terminal response (goodbye) returns Hangup without fallback."""
@@ -8,8 +8,10 @@ These tests verify:
 4. /twilio/poll hangs up after timeout
 """
 
+import asyncio
+import time
+
 import pytest
-from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
 
@@ -73,6 +75,28 @@ class TestTwilioGatherFiller:
             assert "attempt=0" in content
             # Note: Pause is optional in the implementation
 
+    def test_gather_starts_generation_before_responding(self, client, sample_call_run):
+        """Verify the agent reply generation is started by the handler itself."""
+        with patch("app.main.twilio_service") as mock_service, \
+                patch("app.main.asyncio.create_task", wraps=asyncio.create_task) as create_task:
+            mock_service.generate_agent_response_async = AsyncMock()
+
+            response = client.post(
+                "/twilio/gather",
+                params={
+                    "conversationId": sample_call_run.conversation_id,
+                    "turn": "1",
+                    "retry": "0",
+                },
+                data={"SpeechResult": "Yes we have it"},
+            )
+
+            assert response.status_code == 200
+            create_task.assert_called_once()
+            mock_service.generate_agent_response_async.assert_called_once_with(
+                sample_call_run.call_id, "Yes we have it"
+            )
+
     def test_gather_silence_retry(self, client, sample_call_run):
         """Verify silence handling still works."""
         response = client.post(
@@ -120,7 +144,7 @@ class TestTwilioPoll:
         """Verify /twilio/poll returns Gather when response is ready."""
         # Set up pending response
         sample_call_run.pending_agent_reply = "Hello, how can I help you?"
-        sample_call_run.pending_started_at = datetime.utcnow()
+        sample_call_run.pending_started_at = time.monotonic()
 
         response = client.post(
             "/twilio/poll",
@@ -147,7 +171,7 @@ class TestTwilioPoll:
         """Verify /twilio/poll continues polling when response not ready."""
         # No pending reply yet
         sample_call_run.pending_agent_reply = None
-        sample_call_run.pending_started_at = datetime.utcnow()
+        sample_call_run.pending_started_at = time.monotonic()
         sample_call_run.is_generating = True
 
         response = client.post(
@@ -171,7 +195,7 @@ class TestTwilioPoll:
     def test_poll_resets_attempt_after_3(self, client, sample_call_run):
         """Verify attempt counter resets after 3."""
         sample_call_run.pending_agent_reply = None
-        sample_call_run.pending_started_at = datetime.utcnow()
+        sample_call_run.pending_started_at = time.monotonic()
 
         response = client.post(
             "/twilio/poll",
@@ -192,7 +216,7 @@ class TestTwilioPoll:
         """Verify hangup after timeout (>20 seconds)."""
         # Set started_at to 25 seconds ago
         sample_call_run.pending_agent_reply = None
-        sample_call_run.pending_started_at = datetime.utcnow() - timedelta(seconds=25)
+        sample_call_run.pending_started_at = time.monotonic() - 25
 
         response = client.post(
             "/twilio/poll",